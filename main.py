@@ -23,10 +23,8 @@ warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL")
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.config import load_config, print_config_summary, ConfigError
-from src.orchestrator import create_orchestrator
-from src.blockchain import create_blockchain_client, BlockchainError
-from src.utils.logger import setup_logger, get_logger
+# NOTE: src.* imports are deferred into main() so `--help` doesn't pay for
+# importing web3/eth_account/rich, and `--dry-run` skips the orchestrator.
 
 
 def parse_args() -> argparse.Namespace:
@@ -75,6 +73,9 @@ def main():
     """Main entry point."""
     args = parse_args()
     
+    from src.config import load_config, print_config_summary, ConfigError
+    from src.utils.logger import setup_logger, get_logger
+    
     # Setup initial logger
     log_level = "DEBUG" if args.debug else "INFO"
     setup_logger(level=log_level)
@@ -91,14 +92,18 @@ def main():
         
         # Dry run - validate and show balances
         if args.dry_run:
+            from src.blockchain import create_blockchain_client, BlockchainError
+            
             print_config_summary(config)
             
             try:
                 blockchain = create_blockchain_client(config)
                 
-                # Show current epoch
-                epoch, remaining = blockchain.get_epoch_info()
-                total_beth, total_worm = blockchain.get_protocol_stats()
+                # Epoch, protocol totals and all wallet balances in one batch
+                dashboard, balances = blockchain.dry_run_snapshot(
+                    [wallet.checksum_address for wallet in config.wallets]
+                )
+                epoch, remaining, total_beth, total_worm = dashboard
                 
                 logger.info("[bold]Protocol Status:[/bold]")
                 
@@ -121,8 +126,7 @@ def main():
                 
                 # Show wallet balances
                 logger.info("[bold]Wallet Balances (Sepolia):[/bold]")
-                for wallet in config.wallets:
-                    eth, beth, worm = blockchain.get_all_balances(wallet.address)
+                for wallet, (eth, beth, worm) in zip(config.wallets, balances):
                     logger.info(
                         f"  • {wallet.short_address}: "
                         f"[yellow]{eth:.4f} ETH[/yellow] | "
@@ -138,6 +142,7 @@ def main():
             return 0
         
         # Create orchestrator
+        from src.orchestrator import create_orchestrator
         orchestrator = create_orchestrator(config)
         
         # Single cycle mode
@@ -81,6 +81,18 @@ install_requirements() {
     echo "✓ Dependencies installed"
 }
 
+# Build optional compiled PoW search (falls back to pure Python if this fails)
+build_extensions() {
+    echo ""
+    echo "⚙️  Building compiled PoW search (optional)..."
+    
+    if pip install "cython==3.3.0" -q && cythonize -i -q src/_crypto.pyx > /dev/null 2>&1; then
+        echo "✓ Compiled PoW search built"
+    else
+        echo "⚠️  Could not build compiled PoW search - using pure Python (slower)"
+    fi
+}
+
 # Setup .env
 setup_env() {
     echo ""
@@ -128,6 +140,7 @@ main() {
     check_python
     setup_venv
     install_requirements
+    build_extensions
     setup_env
     verify
     
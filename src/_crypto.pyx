@@ -0,0 +1,149 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled burn_key PoW search for WORM Protocol.
+
+Optional accelerator for crypto._search_burn_key: a typed C loop over a
+fixed 104-byte preimage with an inlined Keccak-256, so no Python objects
+are touched per trial. Build in place with:
+
+    cythonize -i src/_crypto.pyx
+
+crypto.py falls back to the pure-Python search when this isn't compiled.
+"""
+
+from libc.stdint cimport uint8_t, uint64_t
+from libc.string cimport memcpy, memset
+
+
+# Keccak-f[1600] round constants, rotation offsets and pi lane order
+cdef uint64_t _RC[24]
+_RC[:] = [
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+]
+cdef int _ROTC[24]
+_ROTC[:] = [1, 3, 6, 10, 15, 21, 28, 36, 45, 55, 2, 14, 27, 41, 56, 8, 25, 43, 62, 18, 39, 61, 20, 44]
+cdef int _PILN[24]
+_PILN[:] = [10, 7, 11, 17, 18, 3, 5, 16, 8, 21, 24, 4, 15, 23, 19, 13, 12, 2, 20, 14, 22, 9, 6, 1]
+
+# Keccak-256 rate in bytes; the 104-byte preimage fits in one block
+cdef enum:
+    RATE = 136
+    PREIMAGE_LEN = 104
+
+
+cdef inline uint64_t _rotl(uint64_t x, int n) noexcept nogil:
+    return (x << n) | (x >> (64 - n))
+
+
+cdef inline uint64_t _load64(const uint8_t* p) noexcept nogil:
+    """Little-endian load (Keccak lanes are LE regardless of host order)."""
+    cdef uint64_t v = 0
+    cdef int i
+    for i in range(7, -1, -1):
+        v = (v << 8) | p[i]
+    return v
+
+
+cdef void _keccakf(uint64_t* st) noexcept nogil:
+    cdef uint64_t bc[5]
+    cdef uint64_t t
+    cdef int i, j, r
+
+    for r in range(24):
+        # Theta
+        for i in range(5):
+            bc[i] = st[i] ^ st[i + 5] ^ st[i + 10] ^ st[i + 15] ^ st[i + 20]
+        for i in range(5):
+            t = bc[(i + 4) % 5] ^ _rotl(bc[(i + 1) % 5], 1)
+            for j in range(0, 25, 5):
+                st[j + i] ^= t
+
+        # Rho + Pi
+        t = st[1]
+        for i in range(24):
+            j = _PILN[i]
+            bc[0] = st[j]
+            st[j] = _rotl(t, _ROTC[i])
+            t = bc[0]
+
+        # Chi
+        for j in range(0, 25, 5):
+            for i in range(5):
+                bc[i] = st[j + i]
+            for i in range(5):
+                st[j + i] ^= (~bc[(i + 1) % 5]) & bc[(i + 2) % 5]
+
+        # Iota
+        st[0] ^= _RC[r]
+
+
+cdef inline bint _has_leading_zeros(const uint64_t* st, int zero_bytes) noexcept nogil:
+    cdef int k
+    for k in range(zero_bytes):
+        if (st[k >> 3] >> ((k & 7) * 8)) & 0xFF:
+            return False
+    return True
+
+
+def search_chunk(bytes start, bytes tail, Py_ssize_t count, int zero_bytes):
+    """
+    Hash `count` consecutive 256-bit nonces from `start` with a fixed tail.
+
+    The caller guarantees start + count doesn't cross the BN254 modulus,
+    so the nonce is a plain big-endian counter here.
+
+    Args:
+        start: First nonce as 32 big-endian bytes
+        tail: Loop-invariant 72-byte preimage tail (reveal, extra commit, tag)
+        count: Number of nonces to try
+        zero_bytes: Required leading zero bytes of the hash
+
+    Returns:
+        Offset from `start` of the first valid nonce, or -1 if none
+    """
+    cdef uint8_t block[RATE]
+    cdef uint8_t ctr[32]
+    cdef uint64_t template[25]
+    cdef uint64_t st[25]
+    cdef Py_ssize_t n, found = -1
+    cdef int i
+
+    if len(start) != 32 or len(tail) != PREIMAGE_LEN - 32:
+        raise ValueError("start must be 32 bytes and tail 72 bytes")
+    zero_bytes = min(max(zero_bytes, 0), 32)
+
+    # Absorb the constant part once: tail + Keccak padding (0x01 ... 0x80)
+    memset(block, 0, RATE)
+    memcpy(block + 32, <const char*>tail, PREIMAGE_LEN - 32)
+    block[PREIMAGE_LEN] ^= 0x01
+    block[RATE - 1] ^= 0x80
+    for i in range(RATE // 8):
+        template[i] = _load64(block + 8 * i)
+    for i in range(RATE // 8, 25):
+        template[i] = 0
+
+    memcpy(ctr, <const char*>start, 32)
+
+    with nogil:
+        for n in range(count):
+            memcpy(st, template, sizeof(st))
+            for i in range(4):
+                st[i] = _load64(ctr + 8 * i)
+            _keccakf(st)
+
+            if _has_leading_zeros(st, zero_bytes):
+                found = n
+                break
+
+            # Big-endian increment of the nonce
+            for i in range(31, -1, -1):
+                ctr[i] += 1
+                if ctr[i] != 0:
+                    break
+
+    return found
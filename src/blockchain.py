@@ -4,17 +4,30 @@ Blockchain interaction layer using web3.py.
 Handles balance queries for ETH and BETH tokens.
 """
 
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import requests
+from eth_abi import decode as abi_decode
 from web3 import Web3
 from web3.exceptions import Web3Exception
 
 from .config import FarmingConfig
+from .utils.http import create_session
 from .utils.logger import get_logger
 from .utils.retry import retry_with_backoff
 
 
+# Unit conversion constants (ETH, BETH and WORM all use 18 decimals)
+_WEI_PER_ETH = Decimal(10 ** 18)
+_WEI_PER_GWEI = Decimal(10 ** 9)
+
+# How long a fetched block number is reused (Sepolia blocks are ~12s apart)
+BLOCK_NUMBER_TTL = 0.5
+
 # BETH Token Contract on Sepolia
 BETH_CONTRACT_ADDRESS = "0x716bC7e331c9Da551e5Eb6A099c300db4c08E994"
 
@@ -86,11 +99,79 @@ WORM_EPOCH_ABI = [
 ]
 
 
+# Multicall3 - deployed at the same address on every major chain (incl. Sepolia)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Multicall3 ABI fragment for batched reads
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {"name": "requireSuccess", "type": "bool"},
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "callData", "type": "bytes"}
+                ]
+            }
+        ],
+        "name": "tryAggregate",
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ]
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+
+# Full WORM ABI (ERC20 + epoch views), built once at import time
+WORM_FULL_ABI = ERC20_ABI + WORM_EPOCH_ABI
+
+# Checksummed contract addresses, computed once at import time
+BETH_CHECKSUM = Web3.to_checksum_address(BETH_CONTRACT_ADDRESS)
+WORM_CHECKSUM = Web3.to_checksum_address(WORM_CONTRACT_ADDRESS)
+MULTICALL3_CHECKSUM = Web3.to_checksum_address(MULTICALL3_ADDRESS)
+
+
 class BlockchainError(Exception):
     """Raised when blockchain interaction fails."""
     pass
 
 
+def create_web3(rpc_url: str, session: Optional[requests.Session] = None) -> Web3:
+    """
+    Create a Web3 instance over a pooled keep-alive HTTP session.
+    
+    Args:
+        rpc_url: JSON-RPC endpoint
+        session: Optional session to share between clients
+        
+    Returns:
+        Web3 instance
+    """
+    return Web3(Web3.HTTPProvider(
+        rpc_url,
+        session=session or create_session(),
+        request_kwargs={"timeout": 30},
+    ))
+
+
 class BlockchainClient:
     """
     Client for blockchain interactions.
@@ -108,18 +189,67 @@ class BlockchainClient:
         self.config = config
         self.logger = get_logger()
         
-        # Initialize web3
-        self.w3 = Web3(Web3.HTTPProvider(config.rpc_url))
+        # Initialize web3 over a pooled keep-alive session
+        self.w3 = create_web3(config.rpc_url)
         
         # Initialize token contracts
         self.beth_contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(BETH_CONTRACT_ADDRESS),
+            address=BETH_CHECKSUM,
             abi=ERC20_ABI
         )
         self.worm_contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(WORM_CONTRACT_ADDRESS),
-            abi=ERC20_ABI + WORM_EPOCH_ABI
+            address=WORM_CHECKSUM,
+            abi=WORM_FULL_ABI
         )
+        self.multicall = self.w3.eth.contract(
+            address=MULTICALL3_CHECKSUM,
+            abi=MULTICALL3_ABI
+        )
+        
+        # Per-block cache for contract views: (name, block_number) -> value
+        self._cache: Dict[Tuple[str, int], Any] = {}
+        # (monotonic timestamp, block number) from the last get_block_number()
+        self._block_number: Optional[Tuple[float, int]] = None
+    
+    def get_block_number(self) -> int:
+        """
+        Get the latest block number, reusing it for BLOCK_NUMBER_TTL seconds.
+        
+        Returns:
+            Latest block number
+        """
+        cached = self._block_number
+        if cached is not None and time.monotonic() - cached[0] < BLOCK_NUMBER_TTL:
+            return cached[1]
+        block_number = self.w3.eth.block_number
+        self._block_number = (time.monotonic(), block_number)
+        return block_number
+    
+    def _cached(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Return a contract view result, reusing it within the same block.
+        
+        Epoch and protocol values only change once per block, so a cheap
+        eth_blockNumber gates the more expensive eth_call.
+        
+        Args:
+            key: Cache key for the view (e.g. function name)
+            fn: Zero-arg callable performing the actual call
+            
+        Returns:
+            Cached or freshly fetched value
+        """
+        cache_key = (key, self.get_block_number())
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        
+        value = fn()
+        self._cache[cache_key] = value
+        
+        # Keep the cache bounded - evict oldest entries first
+        while len(self._cache) > 64:
+            self._cache.pop(next(iter(self._cache)), None)
+        return value
     
     def check_connection(self) -> bool:
         """
@@ -130,7 +260,8 @@ class BlockchainClient:
         """
         try:
             connected = self.w3.is_connected()
-            if connected:
+            # Chain/block details cost two extra RPCs - only fetch for debug
+            if connected and self.logger.isEnabledFor(logging.DEBUG):
                 chain_id = self.w3.eth.chain_id
                 block = self.w3.eth.block_number
                 self.logger.debug(f"Connected to chain {chain_id}, block {block}")
@@ -139,24 +270,39 @@ class BlockchainClient:
             self.logger.error(f"RPC connection check failed: {e}")
             return False
     
+    def _eth_balance_wei(self, address: str) -> int:
+        """Get native ETH balance for an address in wei (single attempt)."""
+        try:
+            return self.w3.eth.get_balance(address)
+        except Exception as e:
+            raise BlockchainError(f"Failed to get ETH balance for {address}: {e}")
+    
+    def _beth_balance_wei(self, address: str) -> int:
+        """Get BETH token balance for an address in wei (single attempt)."""
+        try:
+            return self.beth_contract.functions.balanceOf(address).call()
+        except Exception as e:
+            raise BlockchainError(f"Failed to get BETH balance for {address}: {e}")
+    
+    def _worm_balance_wei(self, address: str) -> int:
+        """Get WORM token balance for an address in wei (single attempt)."""
+        try:
+            return self.worm_contract.functions.balanceOf(address).call()
+        except Exception as e:
+            raise BlockchainError(f"Failed to get WORM balance for {address}: {e}")
+    
     @retry_with_backoff(max_retries=3, base_delay=2.0, operation_name="get_eth_balance")
     def get_eth_balance(self, address: str) -> Decimal:
         """
         Get native ETH balance for an address.
         
         Args:
-            address: Ethereum address
+            address: EIP-55 checksummed Ethereum address
             
         Returns:
             Balance in ETH as Decimal
         """
-        try:
-            checksum_addr = Web3.to_checksum_address(address)
-            balance_wei = self.w3.eth.get_balance(checksum_addr)
-            balance_eth = Decimal(str(self.w3.from_wei(balance_wei, "ether")))
-            return balance_eth
-        except Web3Exception as e:
-            raise BlockchainError(f"Failed to get ETH balance for {address}: {e}")
+        return Decimal(self._eth_balance_wei(address)) / _WEI_PER_ETH
     
     @retry_with_backoff(max_retries=3, base_delay=2.0, operation_name="get_beth_balance")
     def get_beth_balance(self, address: str) -> Decimal:
@@ -164,19 +310,13 @@ class BlockchainClient:
         Get BETH token balance for an address.
         
         Args:
-            address: Ethereum address
+            address: EIP-55 checksummed Ethereum address
             
         Returns:
             Balance in BETH as Decimal
         """
-        try:
-            checksum_addr = Web3.to_checksum_address(address)
-            balance_raw = self.beth_contract.functions.balanceOf(checksum_addr).call()
-            # BETH has 18 decimals like ETH
-            balance = Decimal(str(balance_raw)) / Decimal(10 ** 18)
-            return balance
-        except Web3Exception as e:
-            raise BlockchainError(f"Failed to get BETH balance for {address}: {e}")
+        # BETH has 18 decimals like ETH
+        return Decimal(self._beth_balance_wei(address)) / _WEI_PER_ETH
     
     @retry_with_backoff(max_retries=3, base_delay=2.0, operation_name="get_worm_balance")
     def get_worm_balance(self, address: str) -> Decimal:
@@ -184,35 +324,167 @@ class BlockchainClient:
         Get WORM token balance for an address.
         
         Args:
-            address: Ethereum address
+            address: EIP-55 checksummed Ethereum address
             
         Returns:
             Balance in WORM as Decimal
         """
-        try:
-            checksum_addr = Web3.to_checksum_address(address)
-            balance_raw = self.worm_contract.functions.balanceOf(checksum_addr).call()
-            # Assuming WORM has 18 decimals
-            balance = Decimal(str(balance_raw)) / Decimal(10 ** 18)
-            return balance
-        except Web3Exception as e:
-            raise BlockchainError(f"Failed to get WORM balance for {address}: {e}")
+        # Assuming WORM has 18 decimals
+        return Decimal(self._worm_balance_wei(address)) / _WEI_PER_ETH
     
     def get_all_balances(self, address: str) -> Tuple[Decimal, Decimal, Decimal]:
         """
         Get all balances (ETH, BETH, WORM) for an address.
         
+        Display-friendly wrapper around get_all_balances_wei().
+        
         Args:
-            address: Ethereum address
+            address: EIP-55 checksummed Ethereum address
             
         Returns:
             Tuple of (eth_balance, beth_balance, worm_balance)
         """
-        eth = self.get_eth_balance(address)
-        beth = self.get_beth_balance(address)
-        worm = self.get_worm_balance(address)
+        eth, beth, worm = (
+            Decimal(raw) / _WEI_PER_ETH for raw in self.get_all_balances_wei(address)
+        )
+        return eth, beth, worm
+    
+    @retry_with_backoff(max_retries=3, base_delay=2.0, operation_name="get_all_balances")
+    def get_all_balances_wei(self, address: str) -> Tuple[int, int, int]:
+        """
+        Get all balances (ETH, BETH, WORM) for an address, in wei.
+        
+        Batches the three reads into a single Multicall3 eth_call, so each
+        wallet costs one RPC round-trip instead of three. Any sub-call that
+        fails inside the aggregate falls back to its individual query; if
+        Multicall3 itself is unavailable, the three queries run concurrently.
+        Fallbacks are single attempts, so the retry here is the only one.
+        
+        Args:
+            address: EIP-55 checksummed Ethereum address
+            
+        Returns:
+            Tuple of (eth_wei, beth_wei, worm_wei)
+        """
+        try:
+            calls = [
+                (
+                    self.multicall.address,
+                    self.multicall.encode_abi("getEthBalance", args=[address]),
+                ),
+                (
+                    self.beth_contract.address,
+                    self.beth_contract.encode_abi("balanceOf", args=[address]),
+                ),
+                (
+                    self.worm_contract.address,
+                    self.worm_contract.encode_abi("balanceOf", args=[address]),
+                ),
+            ]
+            results = self.multicall.functions.tryAggregate(False, calls).call()
+        except Exception as e:
+            self.logger.debug(f"Multicall balance fetch failed, falling back: {e}")
+            return self._get_balances_concurrently(address)
+        
+        fallbacks = (self._eth_balance_wei, self._beth_balance_wei, self._worm_balance_wei)
+        balances = []
+        for (success, ret), fallback in zip(results, fallbacks):
+            if success and ret:
+                balances.append(abi_decode(["uint256"], ret)[0])
+            else:
+                balances.append(fallback(address))
+        
+        eth, beth, worm = balances
         return eth, beth, worm
     
+    def get_all_balances_batch(
+        self,
+        addresses: List[str]
+    ) -> Dict[str, Tuple[int, int, int]]:
+        """
+        Get ETH, BETH and WORM balances (in wei) for many addresses in one round-trip.
+        
+        Packs all 3N reads into a single Multicall3 tryAggregate eth_call.
+        An address whose sub-calls fail is re-fetched on its own with
+        get_all_balances_wei(); if the aggregate itself fails, every address
+        is fetched that way concurrently.
+        
+        Args:
+            addresses: EIP-55 checksummed Ethereum addresses
+            
+        Returns:
+            Dict mapping address to (eth_wei, beth_wei, worm_wei).
+            Addresses whose fallback also failed are omitted.
+        """
+        if not addresses:
+            return {}
+        
+        calls = []
+        for address in addresses:
+            calls.append((
+                self.multicall.address,
+                self.multicall.encode_abi("getEthBalance", args=[address]),
+            ))
+            calls.append((
+                self.beth_contract.address,
+                self.beth_contract.encode_abi("balanceOf", args=[address]),
+            ))
+            calls.append((
+                self.worm_contract.address,
+                self.worm_contract.encode_abi("balanceOf", args=[address]),
+            ))
+        
+        try:
+            results = self.multicall.functions.tryAggregate(False, calls).call()
+        except Exception as e:
+            self.logger.debug(f"Multicall batch balance fetch failed, falling back: {e}")
+            results = None
+        
+        balances: Dict[str, Tuple[int, int, int]] = {}
+        missing: List[str] = []
+        for i, address in enumerate(addresses):
+            triple = results[3 * i:3 * i + 3] if results is not None else ()
+            if len(triple) == 3 and all(success and ret for success, ret in triple):
+                eth, beth, worm = (
+                    abi_decode(["uint256"], ret)[0] for _, ret in triple
+                )
+                balances[address] = (eth, beth, worm)
+            else:
+                missing.append(address)
+        
+        if missing:
+            # Partial results: fetch only the failed addresses individually
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                futures = {
+                    address: executor.submit(self.get_all_balances_wei, address)
+                    for address in missing
+                }
+            for address, future in futures.items():
+                try:
+                    balances[address] = future.result()
+                except Exception as e:
+                    self.logger.debug(f"Balance fallback failed for {address}: {e}")
+        
+        return balances
+    
+    def _get_balances_concurrently(self, address: str) -> Tuple[int, int, int]:
+        """
+        Fetch ETH, BETH and WORM balances (in wei) as three parallel RPCs.
+        
+        Single attempts only - get_all_balances_wei retries the whole read.
+        
+        Args:
+            address: EIP-55 checksummed Ethereum address
+            
+        Returns:
+            Tuple of (eth_wei, beth_wei, worm_wei)
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            f_eth = executor.submit(self._eth_balance_wei, address)
+            f_beth = executor.submit(self._beth_balance_wei, address)
+            f_worm = executor.submit(self._worm_balance_wei, address)
+            return f_eth.result(), f_beth.result(), f_worm.result()
+    
     def get_current_epoch(self) -> Optional[int]:
         """
         Get the current epoch from the WORM contract.
@@ -221,7 +493,7 @@ class BlockchainClient:
             Current epoch number, or None if not available
         """
         try:
-            epoch = self.worm_contract.functions.currentEpoch().call()
+            epoch = self._cached("currentEpoch", self.worm_contract.functions.currentEpoch().call)
             return int(epoch)
         except Exception as e:
             self.logger.debug(f"Could not fetch current epoch: {e}")
@@ -237,7 +509,10 @@ class BlockchainClient:
         epoch = self.get_current_epoch()
         remaining = None
         try:
-            remaining = int(self.worm_contract.functions.epochRemainingTime().call())
+            remaining = int(self._cached(
+                "epochRemainingTime",
+                self.worm_contract.functions.epochRemainingTime().call
+            ))
         except Exception:
             pass
         return epoch, remaining
@@ -254,19 +529,119 @@ class BlockchainClient:
         total_worm = None
         
         try:
-            beth_wei = self.worm_contract.functions.totalBeth().call()
-            total_beth = Decimal(str(self.w3.from_wei(beth_wei, 'ether')))
+            beth_wei = self._cached("totalBeth", self.worm_contract.functions.totalBeth().call)
+            total_beth = Decimal(beth_wei) / _WEI_PER_ETH
         except Exception as e:
             self.logger.debug(f"Could not fetch totalBeth: {e}")
         
         try:
-            worm_wei = self.worm_contract.functions.totalWorm().call()
-            total_worm = Decimal(str(self.w3.from_wei(worm_wei, 'ether')))
+            worm_wei = self._cached("totalWorm", self.worm_contract.functions.totalWorm().call)
+            total_worm = Decimal(worm_wei) / _WEI_PER_ETH
         except Exception as e:
             self.logger.debug(f"Could not fetch totalWorm: {e}")
         
         return total_beth, total_worm
     
+    def get_dashboard(
+        self
+    ) -> Tuple[Optional[int], Optional[int], Optional[Decimal], Optional[Decimal]]:
+        """
+        Get epoch info and protocol stats in a single Multicall3 round-trip.
+        
+        Returns:
+            Tuple of (current_epoch, remaining_seconds_in_epoch,
+            total_beth_minted, total_worm_distributed). Any value the
+            contract could not provide is None.
+        """
+        fn_names = ("currentEpoch", "epochRemainingTime", "totalBeth", "totalWorm")
+        calls = [
+            (self.worm_contract.address, self.worm_contract.encode_abi(fn_name))
+            for fn_name in fn_names
+        ]
+        
+        try:
+            results = self.multicall.functions.tryAggregate(False, calls).call()
+        except Exception as e:
+            self.logger.debug(f"Multicall dashboard fetch failed, falling back: {e}")
+            epoch, remaining = self.get_epoch_info()
+            total_beth, total_worm = self.get_protocol_stats()
+            return epoch, remaining, total_beth, total_worm
+        
+        values = []
+        for fn_name, (success, ret) in zip(fn_names, results):
+            if success and ret:
+                values.append(abi_decode(["uint256"], ret)[0])
+            else:
+                self.logger.debug(f"Could not fetch {fn_name}")
+                values.append(None)
+        
+        epoch, remaining, beth_wei, worm_wei = values
+        total_beth = Decimal(beth_wei) / _WEI_PER_ETH if beth_wei is not None else None
+        total_worm = Decimal(worm_wei) / _WEI_PER_ETH if worm_wei is not None else None
+        return epoch, remaining, total_beth, total_worm
+    
+    def dry_run_snapshot(
+        self,
+        addresses: List[str]
+    ) -> Tuple[
+        Tuple[Optional[int], Optional[int], Optional[Decimal], Optional[Decimal]],
+        List[Tuple[Decimal, Decimal, Decimal]],
+    ]:
+        """
+        Fetch the dashboard and every wallet's balances in one JSON-RPC batch.
+        
+        All 4 + 3N reads go out as a single HTTP POST. If the provider
+        rejects batch requests, falls back to the Multicall3 dashboard and
+        per-wallet balance lookups, all issued concurrently.
+        
+        Args:
+            addresses: EIP-55 checksummed wallet addresses
+            
+        Returns:
+            Tuple of (dashboard, balances) where dashboard matches
+            get_dashboard() and balances holds one (eth, beth, worm)
+            tuple per address, in order
+        """
+        try:
+            with self.w3.batch_requests() as batch:
+                batch.add(self.worm_contract.functions.currentEpoch())
+                batch.add(self.worm_contract.functions.epochRemainingTime())
+                batch.add(self.worm_contract.functions.totalBeth())
+                batch.add(self.worm_contract.functions.totalWorm())
+                for address in addresses:
+                    batch.add(self.w3.eth.get_balance(address))
+                    batch.add(self.beth_contract.functions.balanceOf(address))
+                    batch.add(self.worm_contract.functions.balanceOf(address))
+                results = batch.execute()
+        except Exception as e:
+            self.logger.debug(f"Batch snapshot failed, falling back: {e}")
+            # Every lookup is an I/O-bound RPC - run the dashboard and all
+            # wallets concurrently so the fallback is still ~1x RTT
+            with ThreadPoolExecutor(max_workers=min(8, len(addresses) + 1)) as executor:
+                dashboard_future = executor.submit(self.get_dashboard)
+                balance_futures = [
+                    executor.submit(self.get_all_balances, address)
+                    for address in addresses
+                ]
+                return (
+                    dashboard_future.result(),
+                    [future.result() for future in balance_futures],
+                )
+        
+        # Parse the flat result list by known offsets
+        epoch, remaining, beth_wei, worm_wei = results[:4]
+        dashboard = (
+            epoch,
+            remaining,
+            Decimal(beth_wei) / _WEI_PER_ETH,
+            Decimal(worm_wei) / _WEI_PER_ETH,
+        )
+        balances = [
+            tuple(Decimal(raw) / _WEI_PER_ETH for raw in results[i:i + 3])
+            for i in range(4, 4 + 3 * len(addresses), 3)
+        ]
+        return dashboard, balances
+    
     def get_gas_price(self) -> Decimal:
         """
         Get current gas price in Gwei.
@@ -276,7 +651,7 @@ class BlockchainClient:
         """
         try:
             gas_wei = self.w3.eth.gas_price
-            gas_gwei = Decimal(str(self.w3.from_wei(gas_wei, "gwei")))
+            gas_gwei = Decimal(gas_wei) / _WEI_PER_GWEI
             return gas_gwei
         except Web3Exception as e:
             self.logger.warning(f"Failed to get gas price: {e}")
@@ -294,7 +669,7 @@ class BlockchainClient:
         """
         gas_price = self.get_gas_price()
         cost_gwei = gas_price * gas_limit
-        cost_eth = cost_gwei / Decimal(10 ** 9)
+        cost_eth = cost_gwei / _WEI_PER_GWEI
         return cost_eth
 
 
@@ -6,29 +6,58 @@ Loads settings from .env file and provides type-safe configuration objects.
 
 import decimal
 import os
+import re
+import sys
 from dataclasses import dataclass, field
 from decimal import Decimal
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List, Optional
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 from eth_account import Account
 
 from .utils.logger import get_logger
 
 
+# dataclass(slots=True) needs Python 3.10+; fall back to __dict__ on 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Private key format: 0x + 64 hex characters
+_PK_RE = re.compile(r'^0x[a-fA-F0-9]{64}$')
+
+# API key patterns in RPC URLs: /v2/KEY, /v3/KEY, apikey=KEY, key=KEY
+_RPC_MASK_RE = re.compile(
+    r'(?P<prefix>/v[23]/|apikey=|key=)(?P<key>[a-zA-Z0-9_-]{8,})',
+    re.IGNORECASE,
+)
+
+# ETH kept on top of the burn budget to pay for the burn/mint gas
+BURN_GAS_BUFFER_ETH = Decimal("0.01")
+
+# ETH, BETH and WORM all use 18 decimals
+TOKEN_DECIMALS = 18
+
+
 class ConfigError(Exception):
     """Raised when configuration is invalid."""
     pass
 
 
-@dataclass
+@lru_cache(maxsize=32)
+def _derive_address(pk: str) -> str:
+    """Derive the (EIP-55 checksummed) address for a private key, memoized."""
+    return Account.from_key(pk).address
+
+
+@dataclass(**_SLOTS)
 class WalletConfig:
     """Configuration for a single wallet."""
     
-    name: str           # Friendly name (e.g., "Wallet 1")
-    private_key: str    # 0x-prefixed private key
-    address: str        # Derived from private key
+    name: str               # Friendly name (e.g., "Wallet 1")
+    private_key: str        # 0x-prefixed private key
+    address: str            # Derived from private key
+    checksum_address: str = ""  # EIP-55 form of address, computed once
     
     @classmethod
     def from_private_key(cls, pk: str, index: int) -> "WalletConfig":
@@ -41,19 +70,20 @@ class WalletConfig:
             pk = f"0x{pk}"
         
         # Validate format: 0x + 64 hex characters
-        import re
-        if not re.match(r'^0x[a-fA-F0-9]{64}$', pk):
+        if not _PK_RE.match(pk):
             raise ConfigError(
                 f"Invalid private key format for wallet {index + 1}. "
                 "Expected 64 hex characters (with or without 0x prefix)."
             )
         
         try:
-            account = Account.from_key(pk)
+            address = _derive_address(pk)
             return cls(
                 name=f"Wallet {index + 1}",
                 private_key=pk,
-                address=account.address
+                address=address,
+                # eth_account already returns the EIP-55 checksummed form
+                checksum_address=address,
             )
         except Exception as e:
             raise ConfigError(f"Invalid private key for wallet {index + 1}: {e}")
@@ -94,22 +124,45 @@ class FarmingConfig:
     prover_url: str = ""
     prover_backup_url: str = ""
     prover_timeout: int = 600
+    prover_callback_url: str = ""   # Public URL for pushed results (optional)
+    prover_callback_port: int = 8787
+    prover_callback_host: str = "127.0.0.1"  # Bind address for the callback server
     
     # Logging
     log_level: str = "INFO"
     log_to_file: bool = True
     log_file: str = "logs/worm-farmer.log"
     
-    @property
+    @cached_property
     def burn_spend(self) -> Decimal:
         """BETH received from burn = budget - fee."""
         return self.total_eth_budget - self.burn_fee
     
-    @property
+    @cached_property
+    def min_eth_for_burn(self) -> Decimal:
+        """ETH a wallet needs before burning: budget plus gas buffer."""
+        return self.total_eth_budget + BURN_GAS_BUFFER_ETH
+    
+    @cached_property
+    def beth_per_epoch_wei(self) -> int:
+        """beth_per_epoch in wei, for integer balance comparisons."""
+        return int(self.beth_per_epoch.scaleb(TOKEN_DECIMALS))
+    
+    @cached_property
+    def min_eth_for_burn_wei(self) -> int:
+        """min_eth_for_burn in wei, for integer balance comparisons."""
+        return int(self.min_eth_for_burn.scaleb(TOKEN_DECIMALS))
+    
+    @cached_property
     def total_epochs(self) -> int:
         """Number of epochs from budget."""
         return int(self.burn_spend / self.beth_per_epoch)
     
+    @cached_property
+    def masked_rpc_url(self) -> str:
+        """RPC URL with any API key masked, safe for logging."""
+        return _mask_rpc_url(self.rpc_url)
+    
     @property
     def use_remote_prover(self) -> bool:
         """Check if remote prover is configured."""
@@ -169,13 +222,16 @@ def load_config(env_path: Optional[str] = None) -> FarmingConfig:
             f"Copy .env.example to .env and configure it."
         )
     
-    load_dotenv(env_file)
+    # Read .env into a local dict instead of mutating os.environ.
+    # Real environment variables still take precedence, as with load_dotenv.
+    env = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+    env.update(os.environ)
     logger.debug(f"Loaded environment from {env_file}")
     
     # Load wallet private keys (PK1 through PK5)
     wallets: List[WalletConfig] = []
     for i in range(1, 6):  # PK1 to PK5
-        pk = os.getenv(f"PK{i}", "").strip()
+        pk = env.get(f"PK{i}", "").strip()
         if pk:
             try:
                 wallet = WalletConfig.from_private_key(pk, i - 1)
@@ -194,32 +250,35 @@ def load_config(env_path: Optional[str] = None) -> FarmingConfig:
     try:
         config = FarmingConfig(
             # Network
-            rpc_url=os.getenv("RPC_URL", ""),
-            network=os.getenv("NETWORK", "sepolia"),
+            rpc_url=env.get("RPC_URL", ""),
+            network=env.get("NETWORK", "sepolia"),
             
             # Wallets
             wallets=wallets,
             
             # Budget & Mining Strategy
-            total_eth_budget=Decimal(os.getenv("TOTAL_ETH_BUDGET", "0.05")),
-            beth_per_epoch=Decimal(os.getenv("BETH_PER_EPOCH", "0.001")),
-            claim_interval=int(os.getenv("CLAIM_INTERVAL", "5")),
-            burn_fee=Decimal(os.getenv("BURN_FEE", "0.00001")),
+            total_eth_budget=Decimal(env.get("TOTAL_ETH_BUDGET", "0.05")),
+            beth_per_epoch=Decimal(env.get("BETH_PER_EPOCH", "0.001")),
+            claim_interval=int(env.get("CLAIM_INTERVAL", "5")),
+            burn_fee=Decimal(env.get("BURN_FEE", "0.00001")),
             
             # Orchestration
-            loop_interval_seconds=int(os.getenv("LOOP_INTERVAL_SECONDS", "600")),
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            retry_delay_seconds=int(os.getenv("RETRY_DELAY_SECONDS", "30")),
+            loop_interval_seconds=int(env.get("LOOP_INTERVAL_SECONDS", "600")),
+            max_retries=int(env.get("MAX_RETRIES", "3")),
+            retry_delay_seconds=int(env.get("RETRY_DELAY_SECONDS", "30")),
             
             # Remote Prover
-            prover_url=os.getenv("PROVER_URL", ""),
-            prover_backup_url=os.getenv("PROVER_BACKUP_URL", ""),
-            prover_timeout=int(os.getenv("PROVER_TIMEOUT", "600")),
+            prover_url=env.get("PROVER_URL", ""),
+            prover_backup_url=env.get("PROVER_BACKUP_URL", ""),
+            prover_timeout=int(env.get("PROVER_TIMEOUT", "600")),
+            prover_callback_url=env.get("PROVER_CALLBACK_URL", ""),
+            prover_callback_port=int(env.get("PROVER_CALLBACK_PORT", "8787")),
+            prover_callback_host=env.get("PROVER_CALLBACK_HOST", "127.0.0.1"),
             
             # Logging
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            log_to_file=os.getenv("LOG_TO_FILE", "true").lower() == "true",
-            log_file=os.getenv("LOG_FILE", "logs/worm-farmer.log"),
+            log_level=env.get("LOG_LEVEL", "INFO"),
+            log_to_file=env.get("LOG_TO_FILE", "true").lower() == "true",
+            log_file=env.get("LOG_FILE", "logs/worm-farmer.log"),
         )
     except (ValueError, TypeError, decimal.InvalidOperation) as e:
         raise ConfigError(f"Invalid value in configuration: {e}. Check your .env file.")
@@ -239,9 +298,7 @@ def print_config_summary(config: FarmingConfig):
     logger.info("")
     
     logger.info("[bold]Network:[/bold]")
-    # Mask API key in RPC URL
-    masked_rpc = _mask_rpc_url(config.rpc_url)
-    logger.info(f"  • RPC: {masked_rpc}")
+    logger.info(f"  • RPC: {config.masked_rpc_url}")
     logger.info(f"  • Network: {config.network}")
     logger.info("")
     
@@ -274,14 +331,5 @@ def print_config_summary(config: FarmingConfig):
 
 def _mask_rpc_url(url: str) -> str:
     """Mask API key in RPC URL for safe logging."""
-    import re
-    # Match common patterns: /v2/KEY, /v3/KEY, apikey=KEY, key=KEY
-    patterns = [
-        (r'(/v[23]/)([a-zA-Z0-9_-]{8,})', r'\1***MASKED***'),
-        (r'(apikey=)([a-zA-Z0-9_-]{8,})', r'\1***MASKED***'),
-        (r'(key=)([a-zA-Z0-9_-]{8,})', r'\1***MASKED***'),
-    ]
-    masked = url
-    for pattern, replacement in patterns:
-        masked = re.sub(pattern, replacement, masked, flags=re.IGNORECASE)
+    masked = _RPC_MASK_RE.sub(lambda m: m.group("prefix") + "***MASKED***", url)
     return masked[:60] + "..." if len(masked) > 60 else masked
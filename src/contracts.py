@@ -5,19 +5,29 @@ Handles direct on-chain transactions for burn and mint operations,
 enabling Docker-free operation with remote provers.
 """
 
+import time
 from decimal import Decimal
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
 from web3 import Web3
+from web3.exceptions import TransactionNotFound
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
+from eth_utils import keccak
+from hexbytes import HexBytes
+from requests import Session
+from urllib3.util.retry import Retry
 
+from .blockchain import create_web3
 from .config import FarmingConfig, WalletConfig
 from .prover import ProofOutput
+from .utils.http import create_session
 from .utils.logger import get_logger
 
 
 # BETH Contract on Sepolia
 BETH_CONTRACT_ADDRESS = "0x716bC7e331c9Da551e5Eb6A099c300db4c08E994"
+_BETH_CHECKSUM = Web3.to_checksum_address(BETH_CONTRACT_ADDRESS)
 
 # BETH Contract ABI for mintCoin
 BETH_MINT_ABI = [
@@ -54,51 +64,419 @@ class ContractError(Exception):
 MAX_GAS_GWEI = 100
 
 
-class BethContract:
+@lru_cache(maxsize=64)
+def _to_checksum(address: str) -> str:
+    """EIP-55 checksum an address, memoized for the few prover/wallet addresses seen."""
+    return Web3.to_checksum_address(address)
+
+
+def _to_int(value) -> int:
+    """Convert a raw JSON-RPC quantity (hex string or int) to int."""
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+# Headroom on cached eth_estimateGas results (participate/claim)
+GAS_LIMIT_BUFFER = 1.3
+
+# eth_feeHistory window: last 5 blocks, median (50th percentile) tip
+FEE_HISTORY_BLOCKS = 5
+FEE_HISTORY_PERCENTILE = 50
+# Bounds for maxPriorityFeePerGas - Sepolia blocks are often near-empty,
+# and paying above the going tip buys no faster inclusion
+MIN_PRIORITY_FEE_WEI = 10 ** 9
+MAX_PRIORITY_FEE_WEI = 3 * 10 ** 9
+
+# Fee bump (%) for TXs replacing a pending one - nodes require at least 10
+REPLACEMENT_FEE_BUMP = 25
+
+# Send errors meaning the node already has (or has mined) a TX at that nonce
+_ALREADY_SENT_MARKERS = ("already known", "known transaction", "nonce too low")
+
+
+class FeeQuote(NamedTuple):
+    """EIP-1559 fee inputs derived from eth_feeHistory."""
+    base_fee: int
+    priority_fee: int
+
+
+class TxParams(NamedTuple):
+    """Per-transaction parameters fetched in one RPC batch."""
+    fees: FeeQuote
+    nonce: int
+    chain_id: int
+
+
+def _fees_from_history(history: dict) -> FeeQuote:
     """
-    Client for BETH contract interactions.
+    Derive base fee and tip from an eth_feeHistory result.
     
-    Handles sending burn transactions and minting BETH from proofs.
+    Accepts both the raw JSON-RPC response (hex strings) and web3's
+    formatted result (ints).
+    
+    Args:
+        history: eth_feeHistory result with baseFeePerGas and reward
+        
+    Returns:
+        FeeQuote with the next block's base fee and the bounded median tip
+    """
+    # baseFeePerGas has one extra entry: the base fee of the next block
+    base_fee = _to_int(history["baseFeePerGas"][-1])
+    tips = sorted(_to_int(block[0]) for block in history.get("reward") or [] if block)
+    tip = tips[len(tips) // 2] if tips else 0
+    tip = min(max(tip, MIN_PRIORITY_FEE_WEI), MAX_PRIORITY_FEE_WEI)
+    return FeeQuote(base_fee=base_fee, priority_fee=tip)
+
+
+def _prefetch_tx_params(
+    w3: Web3,
+    address: str,
+    chain_id: Optional[int] = None,
+    fees: Optional[FeeQuote] = None,
+) -> TxParams:
+    """
+    Fetch pending nonce plus any unknown fee quote / chain ID in one JSON-RPC batch.
+    
+    Falls back to individual calls if the provider rejects batch requests.
+    
+    Args:
+        w3: Web3 instance
+        address: Sender address
+        chain_id: Already-known chain ID (skips fetching it)
+        fees: Still-fresh fee quote (skips fetching fee history)
+        
+    Returns:
+        TxParams for building the transaction
+    """
+    calls = {"eth_getTransactionCount": [address, "pending"]}
+    if fees is None:
+        calls["eth_feeHistory"] = [
+            hex(FEE_HISTORY_BLOCKS), "latest", [FEE_HISTORY_PERCENTILE]
+        ]
+    if chain_id is None:
+        calls["eth_chainId"] = []
+    
+    try:
+        responses = w3.provider.make_batch_request(list(calls.items()))
+        values = dict(zip(calls, (response["result"] for response in responses)))
+        if len(values) != len(calls):
+            raise ValueError(f"Expected {len(calls)} batch results, got {len(values)}")
+        nonce = _to_int(values["eth_getTransactionCount"])
+        if fees is None:
+            fees = _fees_from_history(values["eth_feeHistory"])
+        if chain_id is None:
+            chain_id = _to_int(values["eth_chainId"])
+    except Exception:
+        nonce = w3.eth.get_transaction_count(address, "pending")
+        if fees is None:
+            fees = _fees_from_history(w3.eth.fee_history(
+                FEE_HISTORY_BLOCKS, "latest", [FEE_HISTORY_PERCENTILE]
+            ))
+        if chain_id is None:
+            chain_id = w3.eth.chain_id
+    
+    return TxParams(fees=fees, nonce=nonce, chain_id=chain_id)
+
+
+def create_rpc_tx_session() -> Session:
+    """
+    Create a pooled keep-alive session for transaction-sending clients.
+    
+    Retries only connection-level failures with a short backoff; urllib3
+    never re-sends a POST whose request may have reached the node.
+    """
+    return create_session(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.1),
+    )
+
+
+def _is_method_unsupported(error: Exception, method: str) -> bool:
+    """
+    Check whether an RPC error means `method` isn't implemented.
+    
+    Only JSON-RPC code -32601, or a "not found" / "does not exist" message
+    naming the method, counts - ordinary rejections of the call don't.
+    """
+    response = getattr(error, "rpc_response", None)
+    if isinstance(response, dict):
+        rpc_error = response.get("error")
+        if isinstance(rpc_error, dict) and rpc_error.get("code") == -32601:
+            return True
+    message = str(error).lower()
+    if "-32601" in message:
+        return True
+    return method.lower() in message and (
+        "not found" in message or "does not exist" in message
+    )
+
+
+def _is_already_sent(error) -> bool:
+    """Check whether a send error may just mean the TX was sent before."""
+    message = str(error).lower()
+    return any(marker in message for marker in _ALREADY_SENT_MARKERS)
+
+
+class _TransactionClient:
+    """
+    Shared transaction plumbing for the BETH and WORM contract clients.
+    
+    Caches the chain ID for the process lifetime and the EIP-1559 fee
+    quote for FEE_TTL seconds, so back-to-back TXs don't re-query them.
     """
     
-    def __init__(self, config: FarmingConfig):
+    # Roughly half a Sepolia block
+    FEE_TTL = 6.0
+    
+    def __init__(self, config: FarmingConfig, session: Optional[Session] = None):
         """
-        Initialize BETH contract client.
+        Initialize shared web3 connection and caches.
         
         Args:
             config: Farming configuration
+            session: Optional pooled HTTP session to share between clients
         """
         self.config = config
         self.logger = get_logger()
-        self.w3 = Web3(Web3.HTTPProvider(config.rpc_url))
+        self.w3 = create_web3(config.rpc_url, session or create_rpc_tx_session())
         
-        self.beth_contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(BETH_CONTRACT_ADDRESS),
-            abi=BETH_MINT_ABI
-        )
+        # Chain ID never changes - fetched once with the first TX
+        self._chain_id: Optional[int] = None
+        # (monotonic timestamp, fee quote)
+        self._fee_cache: Optional[Tuple[float, FeeQuote]] = None
+        # Whether the RPC supports eth_sendRawTransactionSync (None = untested)
+        self._sync_send_supported: Optional[bool] = None
+        # Signing accounts by wallet address - key derivation happens once
+        self._accounts: Dict[str, LocalAccount] = {}
+    
+    def warm_up(self) -> None:
+        """Open the RPC connection and cache the chain ID before the first TX."""
+        try:
+            if self._chain_id is None:
+                self._chain_id = self.w3.eth.chain_id
+        except Exception as e:
+            self.logger.debug(f"RPC warmup failed: {e}")
     
-    def _check_gas_price(self) -> int:
-        """Get gas price and verify it's within safe limits."""
-        gas_price = self.w3.eth.gas_price
+    def _account(self, wallet: WalletConfig) -> LocalAccount:
+        """Get the cached signing account for a wallet."""
+        account = self._accounts.get(wallet.address)
+        if account is None:
+            account = Account.from_key(wallet.private_key)
+            self._accounts[wallet.address] = account
+        return account
+    
+    def _cached_fees(self) -> Optional[FeeQuote]:
+        """Return the cached fee quote if still fresh, else None."""
+        if self._fee_cache is None:
+            return None
+        fetched_at, fees = self._fee_cache
+        if time.monotonic() - fetched_at < self.FEE_TTL:
+            return fees
+        return None
+    
+    def _eip1559_fees(self) -> FeeQuote:
+        """Get base fee and tip from eth_feeHistory, reusing a fresh cached value."""
+        fees = self._cached_fees()
+        if fees is None:
+            fees = _fees_from_history(self.w3.eth.fee_history(
+                FEE_HISTORY_BLOCKS, "latest", [FEE_HISTORY_PERCENTILE]
+            ))
+            self._fee_cache = (time.monotonic(), fees)
+        return fees
+    
+    def _tx_params(self, address: str) -> TxParams:
+        """Fetch nonce plus any uncached fee quote / chain ID in one batch."""
+        cached_fees = self._cached_fees()
+        params = _prefetch_tx_params(self.w3, address, self._chain_id, cached_fees)
+        self._chain_id = params.chain_id
+        if cached_fees is None:
+            self._fee_cache = (time.monotonic(), params.fees)
+        return params
+    
+    def _send_and_wait(
+        self,
+        raw_tx: bytes,
+        label: Optional[str] = None,
+        timeout: int = 120,
+    ) -> Tuple[str, dict]:
+        """
+        Broadcast a signed TX and wait for its receipt.
+        
+        Tries eth_sendRawTransactionSync (EIP-7966) first, which returns the
+        receipt in the same round-trip; falls back to send + receipt polling
+        on endpoints that don't implement it.
+        
+        Args:
+            raw_tx: Signed raw transaction bytes
+            label: Name for the "TX sent" log line (e.g. "Burn")
+            timeout: Max seconds to wait for the receipt
+            
+        Returns:
+            Tuple of (tx_hash hex, receipt with int 'status' and 'blockNumber')
+        """
+        # TX hash is keccak of the signed payload - known before sending
+        tx_hash = HexBytes(keccak(raw_tx))
+        
+        if self._sync_send_supported is not False:
+            try:
+                receipt = self.w3.manager.request_blocking(
+                    "eth_sendRawTransactionSync",
+                    [Web3.to_hex(raw_tx), timeout * 1000],
+                )
+                self._sync_send_supported = True
+                if label:
+                    self.logger.info(f"📤 {label} TX sent: {tx_hash.hex()[:16]}...")
+                return tx_hash.hex(), {
+                    'status': _to_int(receipt['status']),
+                    'blockNumber': _to_int(receipt['blockNumber']),
+                }
+            except Exception as e:
+                if not _is_method_unsupported(e, "eth_sendRawTransactionSync"):
+                    # The node may still have accepted the TX (e.g. sync
+                    # timeout) - only re-raise if it never reached the pool
+                    try:
+                        self.w3.eth.get_transaction(tx_hash)
+                    except TransactionNotFound:
+                        raise e
+                    self.logger.debug(f"Sync send did not return a receipt: {e}")
+                    return tx_hash.hex(), self.w3.eth.wait_for_transaction_receipt(
+                        tx_hash, timeout=timeout
+                    )
+                self.logger.debug("eth_sendRawTransactionSync unsupported, using polling")
+                self._sync_send_supported = False
+        
+        tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
+        if label:
+            self.logger.info(f"📤 {label} TX sent: {tx_hash.hex()[:16]}...")
+        
+        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+        return tx_hash.hex(), receipt
+    
+    def _was_accepted(self, tx_hash: HexBytes, error) -> bool:
+        """
+        Check whether a TX went through despite a send error.
+        
+        A retried send of a TX the node already took fails with "already
+        known" (or "nonce too low" once mined); that counts as sent only if
+        the node has a TX with this exact hash.
+        """
+        if error is None:
+            return True
+        if not _is_already_sent(error):
+            return False
+        try:
+            self.w3.eth.get_transaction(tx_hash)
+        except TransactionNotFound:
+            return False
+        return True
+    
+    def _cancel_nonce(self, account: LocalAccount, params: TxParams, nonce: int) -> HexBytes:
+        """
+        Replace whatever is pending at a nonce with a 0-value self-transfer.
+        
+        Fees are bumped REPLACEMENT_FEE_BUMP% over the quote the original
+        TX was signed with, so the node accepts it as a replacement.
+        
+        Returns:
+            Hash of the cancelling TX
+        """
+        fee_fields = self._fee_fields(params.fees)
+        tx = {
+            'from': account.address,
+            'to': account.address,
+            'value': 0,
+            'gas': 21000,
+            'maxFeePerGas': fee_fields['maxFeePerGas'] * (100 + REPLACEMENT_FEE_BUMP) // 100,
+            'maxPriorityFeePerGas': (
+                fee_fields['maxPriorityFeePerGas'] * (100 + REPLACEMENT_FEE_BUMP) // 100
+            ),
+            'nonce': nonce,
+            'chainId': params.chain_id,
+        }
+        signed_tx = account.sign_transaction(tx)
+        raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
+        return self.w3.eth.send_raw_transaction(raw_tx)
+    
+    def _wait_for_success(self, tx_hash: str, label: str, timeout: int = 120) -> dict:
+        """
+        Wait for a broadcast TX to be mined and check it succeeded.
+        
+        Args:
+            tx_hash: Hash of an already-broadcast TX
+            label: Name for log/error messages (e.g. "Burn")
+            timeout: Max seconds to wait for the receipt
+            
+        Returns:
+            Transaction receipt
+            
+        Raises:
+            ContractError: If the TX reverted
+        """
+        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+        if receipt['status'] != 1:
+            raise ContractError(f"{label} transaction reverted")
+        self.logger.info(f"✓ {label} TX confirmed in block {receipt['blockNumber']}")
+        return receipt
+    
+    def _fee_fields(self, fees: Optional[FeeQuote] = None) -> dict:
+        """
+        Build EIP-1559 fee fields and verify they're within safe limits.
+        
+        maxFeePerGas = 2 * base fee + tip, which survives six consecutive
+        full blocks of base fee growth; capped at MAX_GAS_GWEI.
+        
+        Args:
+            fees: Fee quote from _tx_params (fetched if None)
+            
+        Returns:
+            Dict with maxFeePerGas and maxPriorityFeePerGas for the TX
+            
+        Raises:
+            ContractError: If the base fee alone exceeds MAX_GAS_GWEI
+        """
+        if fees is None:
+            fees = self._eip1559_fees()
         max_gas_wei = self.w3.to_wei(MAX_GAS_GWEI, 'gwei')
         
-        if gas_price > max_gas_wei:
+        if fees.base_fee > max_gas_wei:
             raise ContractError(
-                f"Gas price too high: {gas_price / 1e9:.1f} Gwei "
+                f"Gas price too high: {fees.base_fee / 1e9:.1f} Gwei "
                 f"(max: {MAX_GAS_GWEI} Gwei). Try again later."
             )
-        return gas_price
+        
+        max_fee = min(2 * fees.base_fee + fees.priority_fee, max_gas_wei)
+        priority_fee = min(fees.priority_fee, max_fee)
+        self.logger.debug(
+            f"Gas: base={fees.base_fee/1e9:.2f} Gwei, tip={priority_fee/1e9:.2f} Gwei, "
+            f"max={max_fee/1e9:.2f} Gwei"
+        )
+        return {
+            'maxFeePerGas': max_fee,
+            'maxPriorityFeePerGas': priority_fee,
+        }
+
+
+class BethContract(_TransactionClient):
+    """
+    Client for BETH contract interactions.
+    
+    Handles sending burn transactions and minting BETH from proofs.
+    """
     
-    def _get_optimal_gas(self) -> int:
-        """Get optimal gas price for Sepolia with priority buffer.
+    def __init__(self, config: FarmingConfig, session: Optional[Session] = None):
+        """
+        Initialize BETH contract client.
         
-        Adds 20% buffer to current gas price to ensure TX gets mined quickly.
+        Args:
+            config: Farming configuration
+            session: Optional pooled HTTP session to share between clients
         """
-        base_gas = self._check_gas_price()
-        # Add 20% priority buffer for testnets
-        optimal_gas = int(base_gas * 1.2)
-        self.logger.debug(f"Gas: base={base_gas/1e9:.2f} Gwei, optimal={optimal_gas/1e9:.2f} Gwei")
-        return optimal_gas
+        super().__init__(config, session)
+        
+        self.beth_contract = self.w3.eth.contract(
+            address=_BETH_CHECKSUM,
+            abi=BETH_MINT_ABI
+        )
     
     def send_burn_tx(
         self,
@@ -125,13 +503,16 @@ class BethContract:
                 f"🔥 Sending {amount} ETH to burn address {burn_address[:10]}..."
             )
             
-            account: LocalAccount = Account.from_key(wallet.private_key)
+            account = self._account(wallet)
             
             # Convert amount to wei
             amount_wei = self.w3.to_wei(amount, 'ether')
             
+            # Fee history + nonce + chain ID in one round-trip
+            params = self._tx_params(account.address)
+            
             # SECURITY: Check gas price limits
-            gas_price = self._check_gas_price()
+            fee_fields = self._fee_fields(params.fees)
             
             # Build transaction
             tx = {
@@ -139,30 +520,96 @@ class BethContract:
                 'to': Web3.to_checksum_address(burn_address),
                 'value': amount_wei,
                 'gas': 21000,  # Standard ETH transfer
-                'gasPrice': gas_price,
-                'nonce': self.w3.eth.get_transaction_count(account.address),
-                'chainId': self.w3.eth.chain_id,
+                **fee_fields,
+                'nonce': params.nonce,
+                'chainId': params.chain_id,
             }
             
             # Sign and send
-            signed_tx = self.w3.eth.account.sign_transaction(tx, wallet.private_key)
+            signed_tx = account.sign_transaction(tx)
             raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-            tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-            
-            self.logger.info(f"📤 Burn TX sent: {tx_hash.hex()[:16]}...")
-            
-            # Wait for confirmation
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            tx_hash, receipt = self._send_and_wait(raw_tx, label="Burn", timeout=120)
             
             if receipt['status'] == 1:
                 self.logger.info(f"✓ Burn TX confirmed in block {receipt['blockNumber']}")
-                return tx_hash.hex()
+                return tx_hash
             else:
                 raise ContractError("Burn transaction reverted")
                 
         except Exception as e:
             raise ContractError(f"Failed to send burn TX: {e}")
     
+    def _sign_mint_tx(
+        self,
+        account: LocalAccount,
+        proof_output: ProofOutput,
+        params: TxParams,
+        nonce: int,
+    ) -> bytes:
+        """
+        Build and sign a mintCoin TX for a proof.
+        
+        Args:
+            account: Signing account (receives the BETH)
+            proof_output: Proof from remote prover
+            params: Fee quote and chain ID from _tx_params
+            nonce: Nonce to sign with
+            
+        Returns:
+            Signed raw transaction bytes
+        """
+        # Parse proof data from ProofOutput
+        proof = proof_output.proof
+        
+        # Extract proof arrays (pi_a, pi_b, pi_c)
+        pi_a = [int(proof['pi_a'][0]), int(proof['pi_a'][1])]
+        pi_b = [
+            [int(proof['pi_b'][0][1]), int(proof['pi_b'][0][0])],  # Flipped!
+            [int(proof['pi_b'][1][1]), int(proof['pi_b'][1][0])],
+        ]
+        pi_c = [int(proof['pi_c'][0]), int(proof['pi_c'][1])]
+        
+        # Parse other values from proof output
+        block_number = proof_output.block_number
+        nullifier = int(proof_output.nullifier_u256)
+        remaining_coin = int(proof_output.remaining_coin)
+        broadcaster_fee = int(proof_output.broadcaster_fee)
+        prover_fee = int(proof_output.prover_fee)
+        prover_address = _to_checksum(proof_output.prover)
+        receiver_address = _to_checksum(proof_output.wallet_address)
+        reveal_amount = int(proof_output.reveal_amount)
+        
+        # Encode calldata locally and build the TX dict by hand - no
+        # build_transaction default-filling round-trips
+        data = self.beth_contract.encode_abi("mintCoin", args=[
+            pi_a,
+            pi_b,
+            pi_c,
+            block_number,
+            nullifier,
+            remaining_coin,
+            broadcaster_fee,
+            reveal_amount,
+            receiver_address,
+            prover_fee,
+            prover_address,
+            b'',  # receiverPostMintHook
+            b'',  # broadcasterFeePostMintHook
+        ])
+        mint_tx = {
+            'from': account.address,
+            'to': _BETH_CHECKSUM,
+            'data': data,
+            'value': 0,
+            'gas': 500000,  # Estimated for proof verification
+            **self._fee_fields(params.fees),
+            'nonce': nonce,
+            'chainId': params.chain_id,
+        }
+        
+        signed_tx = account.sign_transaction(mint_tx)
+        return signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
+    
     def mint_from_proof(
         self,
         wallet: WalletConfig,
@@ -186,84 +633,146 @@ class BethContract:
         try:
             self.logger.info(f"📝 Submitting proof to mint BETH...")
             
-            account: LocalAccount = Account.from_key(wallet.private_key)
-            
-            # Parse proof data from ProofOutput
-            proof = proof_output.proof
-            
-            # Extract proof arrays (pi_a, pi_b, pi_c)
-            pi_a = [int(proof['pi_a'][0]), int(proof['pi_a'][1])]
-            pi_b = [
-                [int(proof['pi_b'][0][1]), int(proof['pi_b'][0][0])],  # Flipped!
-                [int(proof['pi_b'][1][1]), int(proof['pi_b'][1][0])],
-            ]
-            pi_c = [int(proof['pi_c'][0]), int(proof['pi_c'][1])]
-            
-            # Convert amounts to wei
-            spend_wei = self.w3.to_wei(spend, 'ether')
-            
-            # Parse other values from proof output
-            block_number = proof_output.block_number
-            nullifier = int(proof_output.nullifier_u256)
-            remaining_coin = int(proof_output.remaining_coin)
-            broadcaster_fee = int(proof_output.broadcaster_fee)
-            prover_fee = int(proof_output.prover_fee)
-            prover_address = Web3.to_checksum_address(proof_output.prover)
-            receiver_address = Web3.to_checksum_address(proof_output.wallet_address)
-            reveal_amount = int(proof_output.reveal_amount)
-            
-            # Build contract call
-            mint_tx = self.beth_contract.functions.mintCoin(
-                pi_a,
-                pi_b,
-                pi_c,
-                block_number,
-                nullifier,
-                remaining_coin,
-                broadcaster_fee,
-                reveal_amount,
-                receiver_address,
-                prover_fee,
-                prover_address,
-                b'',  # receiverPostMintHook
-                b'',  # broadcasterFeePostMintHook
-            ).build_transaction({
-                'from': account.address,
-                'gas': 500000,  # Estimated for proof verification
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': self.w3.eth.get_transaction_count(account.address),
-                'chainId': self.w3.eth.chain_id,
-            })
+            account = self._account(wallet)
+            params = self._tx_params(account.address)
+            raw_tx = self._sign_mint_tx(account, proof_output, params, params.nonce)
             
-            # Sign and send
-            signed_tx = self.w3.eth.account.sign_transaction(mint_tx, wallet.private_key)
-            raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-            tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-            
-            self.logger.info(f"📤 Mint TX sent: {tx_hash.hex()[:16]}...")
-            
-            # Wait for confirmation
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            tx_hash, receipt = self._send_and_wait(raw_tx, label="Mint", timeout=120)
             
             if receipt['status'] == 1:
                 self.logger.info(
                     f"[success]✓[/success] Minted BETH in block {receipt['blockNumber']}"
                 )
-                return tx_hash.hex()
+                return tx_hash
             else:
                 raise ContractError("Mint transaction reverted")
                 
         except Exception as e:
             raise ContractError(f"Failed to mint BETH: {e}")
+    
+    def burn_and_mint(
+        self,
+        wallet: WalletConfig,
+        burn_address: str,
+        amount: Decimal,
+        proof_output: ProofOutput,
+    ) -> Tuple[str, str]:
+        """
+        Burn ETH and mint BETH, broadcasting both TXs in one JSON-RPC batch.
+        
+        Both are signed up front with consecutive nonces (N, N+1), so the
+        network executes the mint strictly after the burn; only the mint
+        receipt is waited for. If the burn is rejected, a mint the node
+        already took is replaced by a self-transfer so it can't execute
+        later on its own.
+        
+        Args:
+            wallet: Wallet that burns and receives the BETH
+            burn_address: Burn address from the proof
+            amount: ETH amount to burn
+            proof_output: Proof from remote prover
+            
+        Returns:
+            Tuple of (burn_tx_hash, mint_tx_hash)
+            
+        Raises:
+            ContractError: If either TX is rejected or the mint fails
+        """
+        try:
+            self.logger.info(
+                f"🔥 Burning {amount} ETH to {burn_address[:10]}... and minting BETH"
+            )
+            
+            account = self._account(wallet)
+            
+            # Nonce + fee quote + chain ID in one round-trip, shared by both TXs
+            params = self._tx_params(account.address)
+            burn_tx = {
+                'from': account.address,
+                'to': Web3.to_checksum_address(burn_address),
+                'value': self.w3.to_wei(amount, 'ether'),
+                'gas': 21000,  # Standard ETH transfer
+                **self._fee_fields(params.fees),
+                'nonce': params.nonce,
+                'chainId': params.chain_id,
+            }
+            signed_burn = account.sign_transaction(burn_tx)
+            raw_burn = signed_burn.rawTransaction if hasattr(signed_burn, 'rawTransaction') else signed_burn.raw_transaction
+            
+            # The mint takes the next nonce with no further RPC
+            raw_mint = self._sign_mint_tx(account, proof_output, params, params.nonce + 1)
+            
+            # TX hashes are keccak of the signed payloads - known before sending
+            burn_hash = HexBytes(keccak(raw_burn))
+            mint_hash = HexBytes(keccak(raw_mint))
+            
+            try:
+                responses = self.w3.provider.make_batch_request([
+                    ("eth_sendRawTransaction", [Web3.to_hex(raw_burn)]),
+                    ("eth_sendRawTransaction", [Web3.to_hex(raw_mint)]),
+                ])
+                if len(responses) != 2:
+                    raise ValueError(f"Expected 2 batch results, got {len(responses)}")
+                burn_error, mint_error = (response.get("error") for response in responses)
+            except Exception as e:
+                # The batch may still have reached the node, so a re-send can
+                # fail with "already known" - _was_accepted sorts that out
+                self.logger.debug(f"Batch send failed ({e}), sending burn and mint one by one")
+                burn_error = mint_error = None
+                try:
+                    self.w3.eth.send_raw_transaction(raw_burn)
+                except Exception as send_error:
+                    burn_error = send_error
+                try:
+                    self.w3.eth.send_raw_transaction(raw_mint)
+                except Exception as send_error:
+                    mint_error = send_error
+            
+            if not self._was_accepted(burn_hash, burn_error):
+                if self._was_accepted(mint_hash, mint_error):
+                    # The mint at N+1 would run whenever N is next used -
+                    # fill N and replace the mint so neither slot lingers
+                    try:
+                        self._cancel_nonce(account, params, params.nonce)
+                    except Exception as cancel_error:
+                        self.logger.debug(f"Nonce {params.nonce} not filled: {cancel_error}")
+                    try:
+                        cancel_hash = self._cancel_nonce(account, params, params.nonce + 1)
+                    except Exception as cancel_error:
+                        self.logger.warning(
+                            f"Burn rejected and the queued mint at nonce {params.nonce + 1} "
+                            f"could not be cancelled - it may still be pending: {cancel_error}"
+                        )
+                    else:
+                        self.logger.warning(
+                            f"Burn rejected; cancelling queued mint with TX "
+                            f"{Web3.to_hex(cancel_hash)[:16]}..."
+                        )
+                raise ContractError(f"Burn TX rejected: {burn_error}")
+            if not self._was_accepted(mint_hash, mint_error):
+                raise ContractError(
+                    f"Mint TX rejected after burn {Web3.to_hex(burn_hash)}: {mint_error}"
+                )
+            
+            self.logger.info(f"📤 Burn + mint TXs sent: {Web3.to_hex(mint_hash)[:16]}...")
+            receipt = self._wait_for_success(mint_hash, "Mint")
+            self.logger.info(
+                f"[success]✓[/success] Minted BETH in block {receipt['blockNumber']}"
+            )
+            return Web3.to_hex(burn_hash), Web3.to_hex(mint_hash)
+            
+        except Exception as e:
+            raise ContractError(f"Failed to burn and mint: {e}")
 
 
-def create_beth_contract(config: FarmingConfig) -> BethContract:
+def create_beth_contract(config: FarmingConfig, session: Optional[Session] = None) -> BethContract:
     """Factory function to create BETH contract client."""
-    return BethContract(config)
+    return BethContract(config, session)
 
 
 # WORM Contract on Sepolia
 WORM_CONTRACT_ADDRESS = "0xcBdF9890B5935F01B2f21583d1885CdC8389eb5F"
+_WORM_CHECKSUM = Web3.to_checksum_address(WORM_CONTRACT_ADDRESS)
 
 # WORM Contract ABI for mining
 WORM_MINE_ABI = [
@@ -314,7 +823,7 @@ ERC20_APPROVE_ABI = [
 ]
 
 
-class WormContract:
+class WormContract(_TransactionClient):
     """
     Client for WORM contract mining operations.
     
@@ -322,49 +831,57 @@ class WormContract:
     NO prover needed - direct web3 calls!
     """
     
-    def __init__(self, config: FarmingConfig):
+    def __init__(self, config: FarmingConfig, session: Optional[Session] = None):
         """
         Initialize WORM contract client.
         
         Args:
             config: Farming configuration
+            session: Optional pooled HTTP session to share between clients
         """
-        self.config = config
-        self.logger = get_logger()
-        self.w3 = Web3(Web3.HTTPProvider(config.rpc_url))
+        super().__init__(config, session)
         
         self.worm_contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(WORM_CONTRACT_ADDRESS),
+            address=_WORM_CHECKSUM,
             abi=WORM_MINE_ABI
         )
         
         self.beth_contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(BETH_CONTRACT_ADDRESS),
+            address=_BETH_CHECKSUM,
             abi=ERC20_APPROVE_ABI
         )
-    def _get_optimal_gas(self) -> int:
-        """Get optimal gas price for Sepolia with priority buffer.
         
-        Adds 20% buffer to current gas price to ensure TX gets mined quickly.
+        # Calibrated participate gas limits by (method, num_epochs) - see _gas_limit
+        self._gas_limits: Dict[Tuple[str, int], int] = {}
+    
+    def _gas_limit(self, key: Tuple[str, int], contract_call, address: str) -> int:
         """
-        base_gas = self.w3.eth.gas_price
-        max_gas_wei = self.w3.to_wei(MAX_GAS_GWEI, 'gwei')
+        Get a gas limit for a WORM call, estimating only the first time.
         
-        if base_gas > max_gas_wei:
-            raise ContractError(
-                f"Gas price too high: {base_gas / 1e9:.1f} Gwei "
-                f"(max: {MAX_GAS_GWEI} Gwei). Try again later."
-            )
+        Only for calls whose gas is fixed by the cached key: participate
+        writes one fresh stake slot per epoch ahead, so its cost depends on
+        the epoch count alone. Callers drop the entry on failure so the
+        next attempt re-estimates.
         
-        # Add 20% priority buffer for testnets
-        optimal_gas = int(base_gas * 1.2)
-        return optimal_gas
+        Args:
+            key: (method name, num_epochs) cache key
+            contract_call: Bound contract function to estimate
+            address: Sender address
+            
+        Returns:
+            Gas limit including GAS_LIMIT_BUFFER
+        """
+        gas_limit = self._gas_limits.get(key)
+        if gas_limit is None:
+            gas_limit = int(contract_call.estimate_gas({'from': address}) * GAS_LIMIT_BUFFER)
+            self._gas_limits[key] = gas_limit
+        return gas_limit
     
     def check_allowance(self, wallet: WalletConfig) -> int:
         """Check BETH allowance for WORM contract."""
         return self.beth_contract.functions.allowance(
-            wallet.address,
-            WORM_CONTRACT_ADDRESS
+            wallet.checksum_address,
+            _WORM_CHECKSUM
         ).call()
     
     def approve_beth(self, wallet: WalletConfig, amount: Decimal) -> str:
@@ -379,7 +896,7 @@ class WormContract:
             Transaction hash
         """
         try:
-            account = Account.from_key(wallet.private_key)
+            account = self._account(wallet)
             amount_wei = self.w3.to_wei(amount, 'ether')
             
             # Check current allowance
@@ -390,26 +907,26 @@ class WormContract:
             
             self.logger.info(f"📝 Approving {amount} BETH for mining...")
             
+            params = self._tx_params(account.address)
+            
             tx = self.beth_contract.functions.approve(
-                WORM_CONTRACT_ADDRESS,
+                _WORM_CHECKSUM,
                 amount_wei
             ).build_transaction({
                 'from': account.address,
                 'gas': 60000,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': self.w3.eth.get_transaction_count(account.address),
-                'chainId': self.w3.eth.chain_id,
+                **self._fee_fields(params.fees),
+                'nonce': params.nonce,
+                'chainId': params.chain_id,
             })
             
-            signed_tx = self.w3.eth.account.sign_transaction(tx, wallet.private_key)
+            signed_tx = account.sign_transaction(tx)
             raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-            tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-            
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
+            tx_hash, receipt = self._send_and_wait(raw_tx, timeout=60)
             
             if receipt['status'] == 1:
                 self.logger.info("✓ BETH approved")
-                return tx_hash.hex()
+                return tx_hash
             else:
                 raise ContractError("Approval transaction reverted")
                 
@@ -434,7 +951,7 @@ class WormContract:
             Transaction hash
         """
         try:
-            account = Account.from_key(wallet.private_key)
+            account = self._account(wallet)
             amount_wei = self.w3.to_wei(amount_per_epoch, 'ether')
             total_beth = amount_per_epoch * num_epochs
             
@@ -445,40 +962,36 @@ class WormContract:
                 f"⛏️ Participating: {amount_per_epoch} BETH × {num_epochs} epochs"
             )
             
-            # Estimate gas for this specific call
-            gas_estimate = self.worm_contract.functions.participate(
+            participate_call = self.worm_contract.functions.participate(
                 amount_wei,
                 num_epochs
-            ).estimate_gas({'from': account.address})
+            )
+            gas_limit = self._gas_limit(("participate", num_epochs), participate_call, account.address)
             
-            tx = self.worm_contract.functions.participate(
-                amount_wei,
-                num_epochs
-            ).build_transaction({
+            params = self._tx_params(account.address)
+            
+            tx = participate_call.build_transaction({
                 'from': account.address,
-                'gas': int(gas_estimate * 1.2),  # 20% buffer
-                'gasPrice': self._get_optimal_gas(),
-                'nonce': self.w3.eth.get_transaction_count(account.address),
-                'chainId': self.w3.eth.chain_id,
+                'gas': gas_limit,
+                **self._fee_fields(params.fees),
+                'nonce': params.nonce,
+                'chainId': params.chain_id,
             })
             
-            signed_tx = self.w3.eth.account.sign_transaction(tx, wallet.private_key)
+            signed_tx = account.sign_transaction(tx)
             raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-            tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-            
-            self.logger.info(f"📤 Participate TX sent: {tx_hash.hex()[:16]}...")
-            
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            tx_hash, receipt = self._send_and_wait(raw_tx, label="Participate", timeout=120)
             
             if receipt['status'] == 1:
                 self.logger.info(
                     f"[success]✓[/success] Participating in {num_epochs} epochs"
                 )
-                return tx_hash.hex()
+                return tx_hash
             else:
                 raise ContractError("Participate transaction reverted")
                 
         except Exception as e:
+            self._gas_limits.pop(("participate", num_epochs), None)
             raise ContractError(f"Failed to participate: {e}")
     
     def claim(
@@ -499,42 +1012,41 @@ class WormContract:
             Transaction hash
         """
         try:
-            account = Account.from_key(wallet.private_key)
+            account = self._account(wallet)
             
             self.logger.info(
                 f"🎁 Claiming WORM for epochs {starting_epoch} to {starting_epoch + num_epochs - 1}"
             )
             
-            # Estimate gas for this specific call
-            gas_estimate = self.worm_contract.functions.claim(
+            claim_call = self.worm_contract.functions.claim(
                 starting_epoch,
                 num_epochs
-            ).estimate_gas({'from': account.address})
+            )
+            # Not cached: claim gas depends on which epochs hold rewards and
+            # which slots are still warm, which changes between claims
+            gas_limit = int(
+                claim_call.estimate_gas({'from': account.address}) * GAS_LIMIT_BUFFER
+            )
             
-            tx = self.worm_contract.functions.claim(
-                starting_epoch,
-                num_epochs
-            ).build_transaction({
+            params = self._tx_params(account.address)
+            
+            tx = claim_call.build_transaction({
                 'from': account.address,
-                'gas': int(gas_estimate * 1.2),  # 20% buffer
-                'gasPrice': self._get_optimal_gas(),
-                'nonce': self.w3.eth.get_transaction_count(account.address),
-                'chainId': self.w3.eth.chain_id,
+                'gas': gas_limit,
+                **self._fee_fields(params.fees),
+                'nonce': params.nonce,
+                'chainId': params.chain_id,
             })
             
-            signed_tx = self.w3.eth.account.sign_transaction(tx, wallet.private_key)
+            signed_tx = account.sign_transaction(tx)
             raw_tx = signed_tx.rawTransaction if hasattr(signed_tx, 'rawTransaction') else signed_tx.raw_transaction
-            tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-            
-            self.logger.info(f"📤 Claim TX sent: {tx_hash.hex()[:16]}...")
-            
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            tx_hash, receipt = self._send_and_wait(raw_tx, label="Claim", timeout=120)
             
             if receipt['status'] == 1:
                 self.logger.info(
                     f"[success]✓[/success] Claimed WORM rewards!"
                 )
-                return tx_hash.hex()
+                return tx_hash
             else:
                 raise ContractError("Claim transaction reverted")
                 
@@ -542,6 +1054,6 @@ class WormContract:
             raise ContractError(f"Failed to claim: {e}")
 
 
-def create_worm_contract(config: FarmingConfig) -> WormContract:
+def create_worm_contract(config: FarmingConfig, session: Optional[Session] = None) -> WormContract:
     """Factory function to create WORM contract client."""
-    return WormContract(config)
+    return WormContract(config, session)
@@ -5,9 +5,11 @@ Implements burn_key generation using Poseidon hash and proof-of-work,
 matching the worm-miner Rust implementation.
 """
 
+import multiprocessing
 import os
 import secrets
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, Tuple
 from eth_utils import keccak
 from web3 import Web3
 
@@ -18,6 +20,29 @@ BN254_PRIME = 218882428718392752222464057452572750885483644004160343436982041865
 # Poseidon prefix constant: keccak256("EIP-7503") mod P
 POSEIDON_PREFIX_VALUE = 5265656504298861414514317065875120428884240036965045859626767452974705356670
 
+# Domain tag appended to every PoW preimage
+EIP_7503_SUFFIX = b"EIP-7503"
+
+# Packed (broadcaster_fee, prover_fee) when both are zero - the common case
+_ZERO_FEES_PACKED = bytes(64)
+
+
+try:
+    # pycryptodome is eth-hash's default backend (pulled in by web3)
+    from Crypto.Hash.keccak import new as _keccak_new
+    
+    def _k256(data) -> bytes:
+        """Keccak-256 via pycryptodome directly, skipping eth_utils' dispatch layers."""
+        return _keccak_new(data=data, digest_bits=256).digest()
+except ImportError:
+    _k256 = keccak
+
+try:
+    # Optional compiled search loop - see src/_crypto.pyx
+    from ._crypto import search_chunk as _search_chunk_compiled
+except ImportError:
+    _search_chunk_compiled = None
+
 
 def bytes_to_int_be(data: bytes) -> int:
     """Convert bytes to big-endian integer."""
@@ -52,19 +77,107 @@ def generate_burn_extra_commit(
     # ABI encode packed: broadcaster_fee (32) + prover_fee (32) + receiver (20) + hook (variable)
     receiver_bytes = bytes.fromhex(receiver[2:] if receiver.startswith('0x') else receiver)
     
-    packed = (
-        int_to_bytes32_be(broadcaster_fee) +
-        int_to_bytes32_be(prover_fee) +
-        receiver_bytes +
-        receiver_hook
-    )
+    if broadcaster_fee == 0 and prover_fee == 0:
+        fees_packed = _ZERO_FEES_PACKED
+    else:
+        fees_packed = int_to_bytes32_be(broadcaster_fee) + int_to_bytes32_be(prover_fee)
     
-    hash_bytes = keccak(packed)
+    packed = fees_packed + receiver_bytes + receiver_hook
+    
+    hash_bytes = _k256(packed)
     # Right shift by 8 bits (1 byte)
     result = bytes_to_int_be(hash_bytes) >> 8
     return result
 
 
+# PoW safety limit (per search)
+MAX_POW_ITERATIONS = 10_000_000
+
+# Difficulty at which generate_burn_inputs switches to the multi-process search
+PARALLEL_POW_MIN_ZERO_BYTES = 3
+
+# How often (in trials) a parallel PoW worker checks whether another won
+_STOP_CHECK_INTERVAL = 4096
+
+
+def _search_burn_key(
+    start: int,
+    pow_min_zero_bytes: int,
+    burn_extra_commit: int,
+    reveal: int,
+    max_iterations: int,
+    stop_event=None,
+) -> Optional[int]:
+    """
+    Scan nonces upward from `start` for a valid burn_key.
+    
+    Args:
+        start: First candidate burn_key (already reduced mod BN254_PRIME)
+        pow_min_zero_bytes: Required leading zero bytes
+        burn_extra_commit: Extra commitment value
+        reveal: Reveal amount (spend in wei)
+        max_iterations: Maximum candidates to try
+        stop_event: Optional shared event; the search gives up once it is set
+        
+    Returns:
+        Valid burn_key, or None if not found / stopped
+    """
+    curr = start
+    
+    # Fixed scratch buffer: curr (32) + reveal (32) + extra_commit (32) + "EIP-7503" (8).
+    # Only the first 32 bytes change per trial, so the loop-invariant tail
+    # is written once instead of being re-encoded and concatenated each time.
+    tail = (
+        int_to_bytes32_be(reveal) +
+        int_to_bytes32_be(burn_extra_commit) +
+        EIP_7503_SUFFIX
+    )
+    buf = bytearray(104)
+    buf[32:] = tail
+    # Fixed-size view of the nonce slot - in-place writes, no resize checks
+    head = memoryview(buf)[:32]
+    
+    # Bind hot callables to locals - avoids a global/attribute lookup per trial
+    search_compiled = _search_chunk_compiled
+    hash_fn = _k256
+    nonce_bytes = int.to_bytes
+    hash_int = int.from_bytes
+    
+    # Hash has >= N leading zero bytes <=> its top 8*N bits are zero
+    zero_shift = max(256 - 8 * pow_min_zero_bytes, 0)
+    
+    for offset in range(0, max_iterations, _STOP_CHECK_INTERVAL):
+        if stop_event is not None and stop_event.is_set():
+            return None
+        
+        chunk = min(_STOP_CHECK_INTERVAL, max_iterations - offset)
+        
+        # The key must stay a field element, so it wraps at BN254_PRIME - but
+        # that only matters for a chunk straddling P, so reduce per chunk
+        # instead of paying a bignum mod per trial
+        if curr + chunk <= BN254_PRIME:
+            if search_compiled is not None:
+                hit = search_compiled(nonce_bytes(curr, 32, 'big'), tail, chunk, pow_min_zero_bytes)
+                if hit >= 0:
+                    return curr + hit
+                curr += chunk
+                continue
+            candidates = range(curr, curr + chunk)
+        else:
+            candidates = [(curr + i) % BN254_PRIME for i in range(chunk)]
+        
+        for candidate in candidates:
+            head[:] = nonce_bytes(candidate, 32, 'big')
+            
+            # Check for leading zero bytes with one shift instead of a byte loop
+            if not hash_int(hash_fn(buf), 'big') >> zero_shift:
+                return candidate
+        
+        curr = (curr + chunk) % BN254_PRIME
+    
+    return None
+
+
 def find_burn_key(
     pow_min_zero_bytes: int,
     burn_extra_commit: int,
@@ -87,41 +200,71 @@ def find_burn_key(
     Returns:
         Valid burn_key as integer
     """
-    # Start with random value
-    curr = secrets.randbits(256)
-    
-    # Ensure within field
-    curr = curr % BN254_PRIME
-    
-    iterations = 0
-    max_iterations = 10_000_000  # Safety limit
-    
-    while iterations < max_iterations:
-        # Build input: curr (32) + reveal (32) + extra_commit (32) + "EIP-7503" (8)
-        input_bytes = (
-            int_to_bytes32_be(curr) +
-            int_to_bytes32_be(reveal) +
-            int_to_bytes32_be(burn_extra_commit) +
-            b"EIP-7503"
-        )
-        
-        hash_bytes = keccak(input_bytes)
-        
-        # Check for leading zero bytes
-        leading_zeros = 0
-        for b in hash_bytes:
-            if b == 0:
-                leading_zeros += 1
-            else:
-                break
+    # Start with random value, reduced into the field
+    start = secrets.randbits(256) % BN254_PRIME
+    
+    burn_key = _search_burn_key(
+        start, pow_min_zero_bytes, burn_extra_commit, reveal, MAX_POW_ITERATIONS
+    )
+    if burn_key is None:
+        raise RuntimeError(f"Failed to find burn_key after {MAX_POW_ITERATIONS} iterations")
+    return burn_key
+
+
+def find_burn_key_parallel(
+    pow_min_zero_bytes: int,
+    burn_extra_commit: int,
+    reveal: int,
+    workers: Optional[int] = None,
+) -> int:
+    """
+    Find a valid burn_key using all CPU cores.
+    
+    Each worker process scans from its own random offset; the first one to
+    find a key signals the rest to stop. Trials are independent, so this
+    scales roughly linearly with core count.
+    
+    Args:
+        pow_min_zero_bytes: Required leading zero bytes
+        burn_extra_commit: Extra commitment value
+        reveal: Reveal amount (spend in wei)
+        workers: Worker process count (default: os.cpu_count())
         
-        if leading_zeros >= pow_min_zero_bytes:
-            return curr
+    Returns:
+        Valid burn_key as integer
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        return find_burn_key(pow_min_zero_bytes, burn_extra_commit, reveal)
+    
+    with multiprocessing.Manager() as manager:
+        stop_event = manager.Event()
         
-        curr = (curr + 1) % BN254_PRIME
-        iterations += 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _search_burn_key,
+                    secrets.randbits(256) % BN254_PRIME,
+                    pow_min_zero_bytes,
+                    burn_extra_commit,
+                    reveal,
+                    MAX_POW_ITERATIONS,
+                    stop_event,
+                )
+                for _ in range(workers)
+            ]
+            
+            for future in as_completed(futures):
+                burn_key = future.result()
+                if burn_key is not None:
+                    stop_event.set()
+                    for other in futures:
+                        other.cancel()
+                    return burn_key
     
-    raise RuntimeError(f"Failed to find burn_key after {max_iterations} iterations")
+    raise RuntimeError(
+        f"Failed to find burn_key after {MAX_POW_ITERATIONS} iterations on {workers} workers"
+    )
 
 
 def compute_nullifier(burn_key: int) -> int:
@@ -172,8 +315,10 @@ def generate_burn_inputs(
         receiver_hook=b'',
     )
     
-    # Find burn_key with PoW
-    burn_key = find_burn_key(
+    # Find burn_key with PoW - spread harder searches across all cores,
+    # where the work dwarfs process startup cost
+    search = find_burn_key_parallel if pow_zero_bytes >= PARALLEL_POW_MIN_ZERO_BYTES else find_burn_key
+    burn_key = search(
         pow_min_zero_bytes=pow_zero_bytes,
         burn_extra_commit=extra_commit,
         reveal=spend_wei,
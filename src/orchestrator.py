@@ -4,19 +4,23 @@ Main orchestration engine for WORM farming.
 Implements the core farming loop: check balances → burn if needed → mine → repeat.
 """
 
+import logging
 import signal
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
-from .config import FarmingConfig, WalletConfig, print_config_summary
+from .config import TOKEN_DECIMALS, FarmingConfig, WalletConfig, print_config_summary
 from .blockchain import BlockchainClient, create_blockchain_client, BlockchainError
 from .remote_miner import RemoteMinerClient, create_remote_miner, RemoteMinerError
 from .utils.logger import (
     get_logger, 
+    get_wallet_logger,
     setup_logger,
     log_cycle_start, 
     log_cycle_end,
@@ -26,6 +30,10 @@ from .utils.logger import (
 )
 
 
+# Separator under each wallet's header line
+_WALLET_RULE = "─" * 40
+
+
 @dataclass
 class WalletState:
     """Runtime state for a wallet."""
@@ -33,10 +41,10 @@ class WalletState:
     address: str
     name: str
     
-    # Balances (updated each cycle)
-    eth_balance: Decimal = Decimal("0")
-    beth_balance: Decimal = Decimal("0")
-    worm_balance: Decimal = Decimal("0")
+    # Balances in wei (updated each cycle); compared as plain ints
+    eth_wei: int = 0
+    beth_wei: int = 0
+    worm_wei: int = 0
     
     # Tracking
     last_burn_time: Optional[datetime] = None
@@ -51,6 +59,16 @@ class WalletState:
     @property
     def short_address(self) -> str:
         return f"{self.address[:6]}...{self.address[-4:]}"
+    
+    @property
+    def eth_balance(self) -> Decimal:
+        """ETH balance in ether, for display only."""
+        return Decimal(self.eth_wei) / 10 ** TOKEN_DECIMALS
+    
+    @property
+    def beth_balance(self) -> Decimal:
+        """BETH balance in ether units, for display only."""
+        return Decimal(self.beth_wei) / 10 ** TOKEN_DECIMALS
 
 
 @dataclass  
@@ -64,6 +82,10 @@ class OrchestratorState:
     is_running: bool = True
     
     wallets: Dict[str, WalletState] = field(default_factory=dict)
+    
+    # Guards the shared totals - wallets are processed on worker threads.
+    # Each WalletState is only touched by its own wallet's thread.
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
 
 class Orchestrator:
@@ -99,12 +121,25 @@ class Orchestrator:
         # Initialize state
         self.state = OrchestratorState()
         
-        # Initialize wallet states
-        for wallet in config.wallets:
+        # Set on shutdown - lets sleeps end immediately instead of polling
+        self._shutdown = threading.Event()
+        
+        # One worker per wallet, kept for the process lifetime rather than
+        # spawning a fresh pool (and its threads) every cycle
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(config.wallets),
+            thread_name_prefix="wallet",
+        )
+        
+        # Initialize wallet states, each with a logger tagged by its address
+        # (wallets are processed concurrently and their lines interleave)
+        self._wallet_loggers: Dict[str, logging.Logger] = {}
+        for index, wallet in enumerate(config.wallets):
             self.state.wallets[wallet.address] = WalletState(
                 address=wallet.address,
                 name=wallet.name
             )
+            self._wallet_loggers[wallet.address] = get_wallet_logger(index, wallet.address)
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -115,32 +150,39 @@ class Orchestrator:
         self.logger.info("")
         self.logger.info("🛑 Shutdown signal received. Finishing current operation...")
         self.state.is_running = False
+        self._shutdown.set()
     
-    def _update_balances(self, wallet: WalletConfig) -> WalletState:
+    def _update_balances(
+        self,
+        wallet: WalletConfig,
+        balances: Optional[Tuple[int, int, int]] = None,
+    ) -> WalletState:
         """
         Update balances for a wallet.
         
         Args:
             wallet: Wallet configuration
+            balances: Already-fetched (eth, beth, worm) wei for this cycle;
+                queried from the chain if None
             
         Returns:
             Updated wallet state
         """
         state = self.state.wallets[wallet.address]
+        logger = self._wallet_loggers[wallet.address]
         
         try:
-            eth, beth, worm = self.blockchain.get_all_balances(wallet.address)
-            state.eth_balance = eth
-            state.beth_balance = beth
-            state.worm_balance = worm
+            if balances is None:
+                balances = self.blockchain.get_all_balances_wei(wallet.checksum_address)
+            state.eth_wei, state.beth_wei, state.worm_wei = balances
             state.consecutive_failures = 0
             
-            log_balance(self.logger, float(beth), float(eth))
+            log_balance(logger, float(state.beth_balance), float(state.eth_balance))
             
         except BlockchainError as e:
             state.consecutive_failures += 1
             state.last_error = str(e)
-            self.logger.error(f"Failed to get balances: {e}")
+            logger.error("Failed to get balances: %s", e)
         
         return state
     
@@ -154,57 +196,67 @@ class Orchestrator:
         Returns:
             True if burn is needed
         """
+        logger = self._wallet_loggers[state.address]
+        
         # Only burn if we don't have enough for 1 epoch
         # (since we participate 1 epoch at a time)
-        if state.beth_balance >= self.config.beth_per_epoch:
-            self.logger.info(
-                f"✓ Sufficient BETH ({state.beth_balance}) for mining. Skipping burn."
+        if state.beth_wei >= self.config.beth_per_epoch_wei:
+            logger.info(
+                "✓ Sufficient BETH (%s) for mining. Skipping burn.", state.beth_balance
             )
             return False
         
         # Check if we have enough ETH to burn
-        min_eth_needed = self.config.total_eth_budget + Decimal("0.01")  # Buffer for gas
-        if state.eth_balance < min_eth_needed:
-            self.logger.warning(
-                f"[warning]⚠[/warning] Insufficient ETH for burn. "
-                f"Need {min_eth_needed}, have {state.eth_balance}"
+        if state.eth_wei < self.config.min_eth_for_burn_wei:
+            logger.warning(
+                "[warning]⚠[/warning] Insufficient ETH for burn. Need %s, have %s",
+                self.config.min_eth_for_burn, state.eth_balance,
             )
             return False
         
-        self.logger.info(
-            f"🔥 Need to burn: BETH balance {state.beth_balance} < 1 epoch ({self.config.beth_per_epoch})"
+        logger.info(
+            "🔥 Need to burn: BETH balance %s < 1 epoch (%s)",
+            state.beth_balance, self.config.beth_per_epoch,
         )
         return True
     
-    def _process_wallet(self, wallet: WalletConfig) -> bool:
+    def _process_wallet(
+        self,
+        wallet: WalletConfig,
+        balances: Optional[Tuple[int, int, int]] = None,
+    ) -> bool:
         """
         Process a single wallet: check, burn if needed, mine.
         
         Args:
             wallet: Wallet to process
+            balances: Prefetched (eth, beth, worm) wei from run_cycle, if any
             
         Returns:
             True if all operations succeeded
         """
-        self.logger.info(f"")
-        self.logger.info(f"🔷 Processing {wallet.name} ({wallet.short_address})")
-        self.logger.info(f"{'─' * 40}")
+        logger = self._wallet_loggers[wallet.address]
+        
+        self.logger.info("")
+        logger.info("🔷 Processing %s", wallet.name)
+        self.logger.info(_WALLET_RULE)
         
         # Update balances
-        state = self._update_balances(wallet)
+        state = self._update_balances(wallet, balances)
         
         # Check for too many failures
         if state.consecutive_failures >= self.config.max_retries:
-            self.logger.error(
-                f"[error]⚠[/error] Skipping wallet due to {state.consecutive_failures} "
-                f"consecutive failures. Last error: {state.last_error}"
+            logger.error(
+                "[error]⚠[/error] Skipping wallet due to %d consecutive failures. "
+                "Last error: %s",
+                state.consecutive_failures, state.last_error,
             )
             return False
         
         # Burn if needed
         if self._should_burn(state):
-            self.logger.info(
-                f"📉 Need more BETH. Burning {self.config.total_eth_budget} ETH..."
+            logger.info(
+                "📉 Need more BETH. Burning %s ETH...", self.config.total_eth_budget
             )
             
             result = self.miner.burn(
@@ -217,34 +269,34 @@ class Orchestrator:
             if result.success:
                 state.last_burn_time = datetime.now()
                 state.burns_count += 1
-                self.state.total_burns += 1
+                with self.state.lock:
+                    self.state.total_burns += 1
                 
-                # Re-fetch balance after burn
-                time.sleep(2)  # Wait for tx to propagate
+                # burn() only succeeds once the mint receipt is confirmed
                 self._update_balances(wallet)
             else:
                 state.consecutive_failures += 1
                 state.last_error = result.error_message
                 return False
         else:
-            self.logger.info(
-                f"✓ Skipping burn - using existing BETH ({state.beth_balance})"
+            logger.info(
+                "✓ Skipping burn - using existing BETH (%s)", state.beth_balance
             )
         
         # Mine (participate in epochs)
         # Check if we have enough BETH for 1 epoch
         state = self.state.wallets[wallet.address]
         
-        if state.beth_balance < self.config.beth_per_epoch:
-            self.logger.warning(
-                f"⚠️ Insufficient BETH ({state.beth_balance}) for 1 epoch "
-                f"(need {self.config.beth_per_epoch})"
+        if state.beth_wei < self.config.beth_per_epoch_wei:
+            logger.warning(
+                "⚠️ Insufficient BETH (%s) for 1 epoch (need %s)",
+                state.beth_balance, self.config.beth_per_epoch,
             )
             return False
         
         # Participate in 1 epoch per cycle (not all at once!)
-        self.logger.info(
-            f"📊 BETH: {state.beth_balance} → participating in 1 epoch"
+        logger.info(
+            "📊 BETH: %s → participating in 1 epoch", state.beth_balance
         )
         
         result = self.miner.mine(
@@ -256,13 +308,15 @@ class Orchestrator:
         if result.success:
             state.last_mine_time = datetime.now()
             state.mines_count += 1
-            self.state.total_mines += 1
+            with self.state.lock:
+                self.state.total_mines += 1
+                should_claim = self.state.total_mines % self.config.claim_interval == 0
             state.consecutive_failures = 0
             
             # Check if we should claim WORM rewards
-            if self.state.total_mines % self.config.claim_interval == 0:
-                self.logger.info(
-                    f"🎁 Claiming WORM (every {self.config.claim_interval} participations)..."
+            if should_claim:
+                logger.info(
+                    "🎁 Claiming WORM (every %d participations)...", self.config.claim_interval
                 )
                 
                 # Get current epoch to calculate claim range
@@ -275,8 +329,9 @@ class Orchestrator:
                         claim_epochs = min(100, current_epoch)  # Claim up to 100 epochs
                         starting_epoch = max(0, current_epoch - claim_epochs)
                         
-                        self.logger.info(
-                            f"📋 Claiming epochs {starting_epoch} to {current_epoch} ({claim_epochs} epochs)"
+                        logger.info(
+                            "📋 Claiming epochs %d to %d (%d epochs)",
+                            starting_epoch, current_epoch, claim_epochs,
                         )
                         
                         claim_result = self.miner.claim(
@@ -286,13 +341,14 @@ class Orchestrator:
                         )
                         
                         if claim_result.success:
-                            self.logger.info(
-                                f"[success]✓[/success] Claimed WORM for epochs {starting_epoch}-{current_epoch}"
+                            logger.info(
+                                "[success]✓[/success] Claimed WORM for epochs %d-%d",
+                                starting_epoch, current_epoch,
                             )
                         else:
-                            self.logger.warning(f"⚠️ Claim failed: {claim_result.error_message}")
+                            logger.warning("⚠️ Claim failed: %s", claim_result.error_message)
                 except Exception as e:
-                    self.logger.warning(f"⚠️ Claim check failed: {e}")
+                    logger.warning("⚠️ Claim check failed: %s", e)
         else:
             state.consecutive_failures += 1
             state.last_error = result.error_message
@@ -314,16 +370,41 @@ class Orchestrator:
         
         success_count = 0
         
-        for wallet in self.config.wallets:
-            if not self.state.is_running:
-                self.logger.info("Shutdown requested, stopping cycle")
-                break
+        # All wallets' balances in one round-trip up front
+        try:
+            prefetched = self.blockchain.get_all_balances_batch(
+                [wallet.checksum_address for wallet in self.config.wallets]
+            )
+        except Exception as e:
+            self.logger.debug("Batch balance prefetch failed: %s", e)
+            prefetched = {}
+        
+        # Wallets are independent and almost entirely waiting on RPC/prover
+        # HTTP calls, so process them concurrently
+        futures = {
+            self._executor.submit(
+                self._process_wallet,
+                wallet,
+                prefetched.get(wallet.checksum_address),
+            ): wallet
+            for wallet in self.config.wallets
+        }
+        
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
             
+            wallet = futures[future]
             try:
-                if self._process_wallet(wallet):
+                if future.result():
                     success_count += 1
             except Exception as e:
-                self.logger.error(f"Unexpected error processing {wallet.name}: {e}")
+                self.logger.error("Unexpected error processing %s: %s", wallet.name, e)
+            
+            # On shutdown, drop wallets that haven't started yet
+            if not self.state.is_running:
+                for pending in futures:
+                    pending.cancel()
         
         cycle_duration = time.time() - cycle_start
         
@@ -334,8 +415,9 @@ class Orchestrator:
         )
         
         self.logger.info(
-            f"📊 Stats: {success_count}/{len(self.config.wallets)} wallets OK | "
-            f"Total burns: {self.state.total_burns} | Total mines: {self.state.total_mines}"
+            "📊 Stats: %d/%d wallets OK | Total burns: %d | Total mines: %d",
+            success_count, len(self.config.wallets),
+            self.state.total_burns, self.state.total_mines,
         )
         
         return success_count == len(self.config.wallets)
@@ -356,16 +438,26 @@ class Orchestrator:
         # Verify connections
         self.logger.info("Verifying connections...")
         
-        if not self.blockchain.check_connection():
+        # Independent round-trips to different hosts - check both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            blockchain_future = executor.submit(self.blockchain.check_connection)
+            prover_future = executor.submit(self.miner.check_prover)
+            blockchain_ok = blockchain_future.result()
+            prover_ok = prover_future.result()
+        
+        if not blockchain_ok:
             self.logger.error("Failed to connect to blockchain. Exiting.")
             return
         self.logger.info("[success]✓[/success] Blockchain connection OK")
         
-        if not self.miner.check_prover():
+        if not prover_ok:
             self.logger.warning("⚠️ Prover health check failed - will retry on first use")
         else:
             self.logger.info("[success]✓[/success] Prover connection OK")
         
+        # Seat pooled connections so cycle 1 doesn't pay connection setup
+        self.miner.warm_up()
+        
         self.logger.info("")
         self.logger.info("Starting farming loop. Press Ctrl+C to stop.")
         self.logger.info("")
@@ -380,25 +472,25 @@ class Orchestrator:
                 
                 # Sleep between cycles
                 self.logger.info(
-                    f"💤 Sleeping for {self.config.loop_interval_seconds}s..."
+                    "💤 Sleeping for %ds...", self.config.loop_interval_seconds
                 )
                 
-                # Interruptible sleep
-                for _ in range(self.config.loop_interval_seconds):
-                    if not self.state.is_running:
-                        break
-                    time.sleep(1)
-                    
+                # Interruptible sleep - returns True as soon as shutdown is signalled
+                if self._shutdown.wait(self.config.loop_interval_seconds):
+                    break
+                
             except KeyboardInterrupt:
                 self.logger.info("")
                 self.logger.info("Keyboard interrupt received")
                 self.state.is_running = False
+                self._shutdown.set()
             except Exception as e:
                 self.logger.error(f"Unexpected error in main loop: {e}")
                 self.logger.info("Continuing after error...")
-                time.sleep(30)  # Brief pause before retry
+                self._shutdown.wait(30)  # Brief pause before retry
         
         # Shutdown
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self._print_summary()
     
     def _print_summary(self):
@@ -9,13 +9,30 @@ Public prover endpoints:
 - https://worm-testnet.metatarz.xyz/proof
 """
 
+import hashlib
+import json
+import threading
 import time
-from dataclasses import dataclass
-from typing import Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
 import requests
+from urllib3.util.retry import Retry
 
+from .utils.http import create_session
 from .utils.logger import get_logger
 
+try:
+    # orjson is optional - several times faster than stdlib json both ways
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        """Compact JSON encoding, returned as bytes like orjson.dumps."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+    
+    _json_loads = json.loads
+
 
 class ProverError(Exception):
     """Raised when prover interaction fails."""
@@ -35,6 +52,7 @@ class ProofInput:
     receiver_hook: str = "0x"
     proof: Optional[dict] = None  # EIP1186 account proof
     block_number: Optional[int] = None
+    callback_url: Optional[str] = None  # Where the prover may POST the result
     
     def to_dict(self) -> dict:
         """Convert to API request format."""
@@ -52,7 +70,13 @@ class ProofInput:
             data["proof"] = self.proof
         if self.block_number is not None:
             data["block_number"] = self.block_number
+        if self.callback_url is not None:
+            data["callback_url"] = self.callback_url
         return data
+    
+    def to_json(self) -> bytes:
+        """Serialize to the JSON request body."""
+        return _json_dumps(self.to_dict())
 
 
 @dataclass
@@ -86,6 +110,30 @@ class ProofOutput:
         )
 
 
+# Status polling backs off from 1s (fast jobs are noticed quickly) by 1.7x per poll
+POLL_INITIAL_INTERVAL = 1.0
+POLL_BACKOFF_FACTOR = 1.7
+
+# Seconds to wait on a stalled submit before also trying the next prover.
+# Close to the 30s submit timeout: every hedge hands the burn key to
+# another prover and may start a duplicate job there
+HEDGE_DELAY = 20.0
+
+# Seconds a long-poll (GET ?wait=N) asks the prover to hold a pending job
+LONG_POLL_WAIT = 30
+
+# A pending long-poll answered in under this fraction of the requested wait
+# wasn't held by the server; after LONG_POLL_MAX_MISSES of those in a row,
+# fall back to plain polling
+LONG_POLL_MIN_HOLD = 0.5
+LONG_POLL_MAX_MISSES = 2
+
+# Per-endpoint timeout for the startup connection warmup
+WARMUP_TIMEOUT = 2.0
+
+# Threads shared by all hedged submits (wallets submit concurrently)
+SUBMIT_WORKERS = 16
+
 # Default public prover endpoints
 DEFAULT_PROVERS = [
     "https://worm-miner-3.darkube.app",
@@ -93,6 +141,108 @@ DEFAULT_PROVERS = [
 ]
 
 
+class _CallbackHandler(BaseHTTPRequestHandler):
+    """Accepts job status POSTs shaped like the GET /proof/{job_id} response."""
+    
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            data = _json_loads(self.rfile.read(length))
+        except ValueError:
+            data = None
+        
+        job_id = _callback_job_id(data)
+        if job_id is None:
+            self.send_response(400)
+        else:
+            self.send_response(204 if self.server.notify(job_id) else 404)
+        self.end_headers()
+    
+    def log_message(self, format, *args):
+        """Silence per-request stderr logging."""
+        pass
+
+
+def _callback_job_id(data) -> Optional[str]:
+    """Extract the job id from a pushed payload, or None if malformed."""
+    if not isinstance(data, dict):
+        return None
+    result = data.get("result")
+    if result is not None and not isinstance(result, dict):
+        return None
+    job_id = data.get("job_id") or (result or {}).get("job_id")
+    return job_id if isinstance(job_id, str) and job_id else None
+
+
+class ProofCallbackServer(ThreadingHTTPServer):
+    """
+    Local HTTP endpoint the prover POSTs to when a job finishes.
+    
+    A push is only a wake-up signal: the endpoint is unauthenticated, so
+    its body is never trusted. The waiter re-fetches the job status from
+    the prover it was submitted to, which is what drives the mint.
+    """
+    
+    daemon_threads = True
+    
+    def __init__(self, port: int, host: str = "127.0.0.1"):
+        """
+        Start serving on a background thread.
+        
+        Args:
+            port: Local port to listen on
+            host: Interface to bind (loopback unless exposed on purpose)
+        """
+        super().__init__((host, port), _CallbackHandler)
+        self._lock = threading.Lock()
+        self._events: Dict[str, threading.Event] = {}
+        threading.Thread(
+            target=self.serve_forever,
+            name="prover-callback",
+            daemon=True,
+        ).start()
+    
+    def expect(self, job_id: str) -> threading.Event:
+        """Register a job and get the event set when it is reported done."""
+        with self._lock:
+            return self._events.setdefault(job_id, threading.Event())
+    
+    def notify(self, job_id: str) -> bool:
+        """Wake the waiter for a job; returns False for unknown jobs."""
+        with self._lock:
+            event = self._events.get(job_id)
+        if event is None:
+            return False
+        event.set()
+        return True
+    
+    def forget(self, job_id: str):
+        """Stop accepting notifications for a job."""
+        with self._lock:
+            self._events.pop(job_id, None)
+
+
+def create_prover_session() -> requests.Session:
+    """
+    Create a pooled keep-alive session for prover traffic.
+    
+    Connections to each prover host are kept open across submits and
+    polls, with TCP keepalive so they survive load-balancer idle timeouts
+    while a proof runs. Polls (GET) are retried on gateway errors with
+    backoff; submits (POST) are never re-sent by urllib3.
+    """
+    return create_session(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        tcp_keepalive=True,
+        headers={
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        },
+    )
+
+
 class ProverClient:
     """
     Client for remote ZK proof generation.
@@ -105,7 +255,11 @@ class ProverClient:
         self,
         prover_url: str = None,
         timeout: int = 600,
-        poll_interval: int = 5,
+        poll_interval: float = 15.0,
+        session: Optional[requests.Session] = None,
+        callback_url: Optional[str] = None,
+        callback_port: int = 0,
+        callback_host: str = "127.0.0.1",
     ):
         """
         Initialize prover client.
@@ -113,19 +267,58 @@ class ProverClient:
         Args:
             prover_url: Base URL of prover service (without /proof)
             timeout: Maximum seconds to wait for proof
-            poll_interval: Seconds between status polls
+            poll_interval: Maximum seconds between status polls
+            session: Optional pooled HTTP session (see create_prover_session)
+            callback_url: Public URL the prover can POST results to; enables
+                the local callback server on `callback_port`
+            callback_port: Local port for the callback server
+            callback_host: Interface the callback server binds to
         """
         self.prover_url = (prover_url or DEFAULT_PROVERS[0]).rstrip("/")
         self.timeout = timeout
         self.poll_interval = poll_interval
         self.logger = get_logger()
         
-        # HTTP session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        })
+        # HTTP session for connection pooling (shared by concurrent jobs)
+        self.session = session or create_prover_session()
+        
+        # Endpoint each in-flight job was accepted by - wallets submit
+        # concurrently and prover_url may switch between their submits
+        self._job_endpoints: Dict[str, str] = {}
+        
+        # Canonical fail-over list (configured URL first, no duplicates) and
+        # the last submit response time seen from each endpoint
+        self._endpoints = tuple(dict.fromkeys(
+            [self.prover_url, *(url.rstrip("/") for url in DEFAULT_PROVERS)]
+        ))
+        self._endpoint_latency: Dict[str, float] = {}
+        
+        # Consecutive un-held long-polls per endpoint (see LONG_POLL_MIN_HOLD)
+        self._long_poll_misses: Dict[str, int] = {}
+        
+        # Single-flight: identical concurrent requests share one prover job
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Long-lived pool for hedged submits - idle threads are reused
+        # instead of spawning a fresh pool per proof
+        self._submit_pool = ThreadPoolExecutor(
+            max_workers=SUBMIT_WORKERS,
+            thread_name_prefix="prover",
+        )
+        
+        # Optional push delivery of results - polling remains the fallback
+        self.callback_url = callback_url or None
+        self.callbacks: Optional[ProofCallbackServer] = None
+        if self.callback_url:
+            try:
+                self.callbacks = ProofCallbackServer(callback_port, callback_host)
+                self.logger.debug(
+                    f"Prover callback server listening on {callback_host}:{callback_port}"
+                )
+            except OSError as e:
+                self.logger.warning(f"Prover callback server unavailable, polling only: {e}")
+                self.callback_url = None
     
     def submit_proof(self, proof_input: ProofInput) -> str:
         """
@@ -140,64 +333,137 @@ class ProverClient:
         Raises:
             ProverError: If submission fails on all endpoints
         """
-        # Try all available endpoints
-        endpoints = [self.prover_url]
-        for backup in DEFAULT_PROVERS:
-            backup = backup.rstrip("/")
-            if backup != self.prover_url:
-                endpoints.append(backup)
+        # Try all endpoints: last successful first, then fastest responders.
+        # Untried endpoints keep their configured order (stable sort).
+        endpoints = sorted(
+            self._endpoints,
+            key=lambda url: (
+                url != self.prover_url,
+                self._endpoint_latency.get(url, float("inf")),
+            ),
+        )
         
+        if self.callback_url and proof_input.callback_url is None:
+            proof_input = replace(proof_input, callback_url=self.callback_url)
+        # Serialized once and shared by every hedged/retried attempt
+        body = proof_input.to_json()
         last_error = None
-        for endpoint in endpoints:
-            url = f"{endpoint}/proof"
-            try:
-                self.logger.debug(f"Submitting proof to {url}")
-                response = self.session.post(
-                    url,
-                    json=proof_input.to_dict(),
-                    timeout=30,
-                )
-                
-                if response.status_code == 429:
-                    self.logger.warning(f"Queue full at {endpoint}, trying next...")
-                    continue
-                
-                if response.status_code == 503:
-                    self.logger.warning(f"Service unavailable at {endpoint}, trying next...")
-                    continue
-                
-                data = response.json()
-                
-                if data.get("status") == "error":
-                    last_error = data.get('message')
-                    self.logger.warning(f"Error from {endpoint}: {last_error}")
-                    continue
-                
-                job_id = data.get("result", {}).get("job_id")
-                if not job_id:
-                    continue
-                
-                # Success! Update prover_url to working endpoint
-                if endpoint != self.prover_url:
-                    self.logger.info(f"⚡ Switched to prover: {endpoint}")
-                    self.prover_url = endpoint
-                
-                self.logger.info(f"Proof job submitted: {job_id[:8]}...")
-                return job_id
+        
+        # Hedged submission: start the next endpoint as soon as the current
+        # one fails, or after HEDGE_DELAY if it's still stalled; the first
+        # endpoint to hand back a job wins. Submits are sent sequentially
+        # unless one stalls, since each hedge shares the burn key
+        remaining = list(endpoints)
+        pending = {}
+        try:
+            while remaining or pending:
+                if remaining:
+                    endpoint = remaining.pop(0)
+                    pending[self._submit_pool.submit(self._submit_to, endpoint, body)] = endpoint
                 
-            except requests.RequestException as e:
-                last_error = str(e)
-                self.logger.warning(f"Failed to reach {endpoint}: {e}")
-                continue
+                done, _ = wait(
+                    pending,
+                    timeout=HEDGE_DELAY if remaining else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    endpoint = pending.pop(future)
+                    try:
+                        job_id = future.result()
+                    except ProverError as e:
+                        # Rank it behind every endpoint that has worked
+                        self._endpoint_latency[endpoint] = float("inf")
+                        last_error = str(e)
+                        continue
+                    
+                    # Success! Update prover_url to working endpoint
+                    if endpoint != self.prover_url:
+                        self.logger.info("⚡ Switched to prover: %s", endpoint)
+                        self.prover_url = endpoint
+                    self._job_endpoints[job_id] = endpoint
+                    
+                    self.logger.info("Proof job submitted: %s...", job_id[:8])
+                    return job_id
+        finally:
+            # Don't wait for slower losers; a loser already in flight may
+            # still start a job, which is logged when it answers
+            for future, endpoint in pending.items():
+                if not future.cancel():
+                    future.add_done_callback(
+                        lambda f, endpoint=endpoint: self._log_orphan(endpoint, f)
+                    )
         
         raise ProverError(f"All prover endpoints failed. Last error: {last_error}")
     
-    def poll_result(self, job_id: str) -> Optional[ProofOutput]:
+    def _log_orphan(self, endpoint: str, future: Future) -> None:
+        """Log a job a losing hedged submit started anyway."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        self.logger.warning(
+            "Hedged submit to %s also started job %s... (result unused)",
+            endpoint,
+            future.result()[:8],
+        )
+    
+    def _submit_to(self, endpoint: str, body: bytes) -> str:
+        """
+        Submit a proof job to a single endpoint.
+        
+        Args:
+            endpoint: Prover base URL
+            body: JSON-encoded proof request
+            
+        Returns:
+            job_id for polling
+            
+        Raises:
+            ProverError: If this endpoint can't accept the job
+        """
+        url = f"{endpoint}/proof"
+        try:
+            self.logger.debug("Submitting proof to %s", url)
+            response = self.session.post(
+                url,
+                data=body,
+                timeout=30,
+            )
+        except requests.RequestException as e:
+            self.logger.warning("Failed to reach %s: %s", endpoint, e)
+            raise ProverError(str(e))
+        
+        if response.status_code == 429:
+            self.logger.warning("Queue full at %s, trying next...", endpoint)
+            raise ProverError(f"Queue full at {endpoint}")
+        
+        if response.status_code == 503:
+            self.logger.warning("Service unavailable at %s, trying next...", endpoint)
+            raise ProverError(f"Service unavailable at {endpoint}")
+        
+        try:
+            data = _json_loads(response.content)
+        except ValueError as e:
+            raise ProverError(f"Invalid response from {endpoint}: {e}")
+        
+        if data.get("status") == "error":
+            message = data.get('message')
+            self.logger.warning("Error from %s: %s", endpoint, message)
+            raise ProverError(message)
+        
+        job_id = data.get("result", {}).get("job_id")
+        if not job_id:
+            raise ProverError(f"No job_id from {endpoint}")
+        
+        self._endpoint_latency[endpoint] = response.elapsed.total_seconds()
+        return job_id
+    
+    def poll_result(self, job_id: str, wait: int = 0) -> Optional[ProofOutput]:
         """
         Poll for proof result.
         
         Args:
             job_id: Job ID from submit_proof
+            wait: If set, ask the prover to hold the request up to this many
+                seconds while the job is still pending (long-poll)
             
         Returns:
             ProofOutput if complete, None if still pending
@@ -205,41 +471,63 @@ class ProverClient:
         Raises:
             ProverError: If proof generation failed
         """
-        url = f"{self.prover_url}/proof/{job_id}"
+        endpoint = self._job_endpoints.get(job_id, self.prover_url)
+        url = f"{endpoint}/proof/{job_id}"
         
         try:
-            response = self.session.get(url, timeout=10)
-            data = response.json()
-            
-            status = data.get("status")
-            
-            if status == "pending":
-                self.logger.debug(f"Job {job_id[:8]}... pending")
-                return None
-            
-            if status == "in_progress":
-                self.logger.debug(f"Job {job_id[:8]}... in progress")
-                return None
-            
-            if status == "error":
-                raise ProverError(f"Proof failed: {data.get('message')}")
+            if wait:
+                response = self.session.get(url, params={"wait": wait}, timeout=wait + 10)
+            else:
+                response = self.session.get(url, timeout=10)
+            data = _json_loads(response.content)
+        except (requests.RequestException, ValueError) as e:
+            raise ProverError(f"Failed to poll result: {e}")
+        
+        return self._parse_status(job_id, data)
+    
+    def _parse_status(self, job_id: str, data: dict) -> Optional[ProofOutput]:
+        """
+        Interpret a job status payload (polled or pushed).
+        
+        Args:
+            job_id: Job ID the payload belongs to
+            data: Status response body
             
-            if status == "completed":
-                result = data.get("result")
-                if not result:
-                    raise ProverError("Completed but no result")
-                return ProofOutput.from_dict(result)
+        Returns:
+            ProofOutput if complete, None if still pending
             
-            self.logger.warning(f"Unknown status: {status}")
+        Raises:
+            ProverError: If proof generation failed
+        """
+        status = data.get("status")
+        
+        if status == "pending":
+            self.logger.debug("Job %s... pending", job_id[:8])
             return None
-            
-        except requests.RequestException as e:
-            raise ProverError(f"Failed to poll result: {e}")
+        
+        if status == "in_progress":
+            self.logger.debug("Job %s... in progress", job_id[:8])
+            return None
+        
+        if status == "error":
+            raise ProverError(f"Proof failed: {data.get('message')}")
+        
+        if status == "completed":
+            result = data.get("result")
+            if not result:
+                raise ProverError("Completed but no result")
+            return ProofOutput.from_dict(result)
+        
+        self.logger.warning("Unknown status: %s", status)
+        return None
     
     def generate_proof(self, proof_input: ProofInput) -> ProofOutput:
         """
         Generate a proof (submit + poll until complete).
         
+        Identical requests made while one is in flight share its job
+        instead of paying the prover twice.
+        
         Args:
             proof_input: Proof generation parameters
             
@@ -249,10 +537,63 @@ class ProverClient:
         Raises:
             ProverError: If proof generation fails or times out
         """
+        key = hashlib.blake2b(
+            json.dumps(proof_input.to_dict(), sort_keys=True).encode(),
+            digest_size=16,
+        ).hexdigest()
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not leader:
+            # Same request already in flight (e.g. a retry) - share its job
+            self.logger.info("Joining in-flight proof request...")
+            return future.result()
+        
+        try:
+            result = self._generate_proof(proof_input)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _generate_proof(self, proof_input: ProofInput) -> ProofOutput:
+        """Submit a proof job and wait for its result."""
         job_id = self.submit_proof(proof_input)
         
+        # With a callback server, waits end early when the result is pushed
+        pushed = self.callbacks.expect(job_id) if self.callbacks else None
+        try:
+            return self._wait_for_proof(job_id, pushed)
+        finally:
+            self._job_endpoints.pop(job_id, None)
+            if self.callbacks:
+                self.callbacks.forget(job_id)
+    
+    def _wait_for_proof(
+        self,
+        job_id: str,
+        pushed: Optional[threading.Event],
+    ) -> ProofOutput:
+        """
+        Wait for a submitted job until it's pushed or done.
+        
+        Without a callback server, long-polls the job's endpoint; endpoints
+        that don't hold the request fall back to polling with backoff.
+        """
+        endpoint = self._job_endpoints.get(job_id, self.prover_url)
         start_time = time.time()
         last_log = 0
+        interval = POLL_INITIAL_INTERVAL
         
         while True:
             elapsed = time.time() - start_time
@@ -264,19 +605,53 @@ class ProverClient:
             
             # Log progress every 30 seconds
             if elapsed - last_log >= 30:
-                self.logger.info(
-                    f"⏳ Waiting for proof... ({int(elapsed)}s elapsed)"
-                )
+                self.logger.info("⏳ Waiting for proof... (%ds elapsed)", elapsed)
                 last_log = elapsed
             
-            result = self.poll_result(job_id)
+            if pushed is not None and pushed.is_set():
+                # Re-fetch from the prover rather than trusting the push
+                pushed.clear()
+                result = self.poll_result(job_id)
+            elif pushed is None and self._long_poll_misses.get(endpoint, 0) < LONG_POLL_MAX_MISSES:
+                # Long-poll: the server answers on completion or after the
+                # hold, so a held reply can be re-issued without sleeping
+                wait_s = max(1, min(LONG_POLL_WAIT, int(self.timeout - elapsed)))
+                poll_start = time.monotonic()
+                result = self.poll_result(job_id, wait=wait_s)
+                if result is None:
+                    if time.monotonic() - poll_start >= wait_s * LONG_POLL_MIN_HOLD:
+                        self._long_poll_misses[endpoint] = 0
+                        continue
+                    self._long_poll_misses[endpoint] = self._long_poll_misses.get(endpoint, 0) + 1
+            else:
+                result = self.poll_result(job_id)
             if result is not None:
-                self.logger.info(
-                    f"✓ Proof generated in {int(elapsed)}s"
-                )
+                self.logger.info("✓ Proof generated in %ds", time.time() - start_time)
                 return result
             
-            time.sleep(self.poll_interval)
+            # Exponential backoff, never sleeping past the deadline
+            delay = max(0.0, min(interval, self.timeout - elapsed))
+            if pushed is not None:
+                pushed.wait(delay)
+            else:
+                time.sleep(delay)
+            interval = min(interval * POLL_BACKOFF_FACTOR, self.poll_interval)
+    
+    def warm_up(self) -> None:
+        """
+        Resolve and connect to every endpoint ahead of the first submit.
+        
+        Best effort: seats a keep-alive connection per host in the session
+        pool so a fail-over submit doesn't pay DNS + TCP + TLS setup.
+        """
+        def touch(endpoint: str):
+            try:
+                self.session.head(endpoint, timeout=WARMUP_TIMEOUT, allow_redirects=False)
+            except requests.RequestException as e:
+                self.logger.debug("Warmup failed for %s: %s", endpoint, e)
+        
+        with ThreadPoolExecutor(max_workers=len(self._endpoints)) as executor:
+            list(executor.map(touch, self._endpoints))
     
     def check_health(self) -> bool:
         """Check if prover is reachable."""
@@ -298,6 +673,9 @@ class ProverClient:
 def create_prover_client(
     prover_url: str = None,
     timeout: int = 600,
+    callback_url: Optional[str] = None,
+    callback_port: int = 0,
+    callback_host: str = "127.0.0.1",
 ) -> ProverClient:
     """
     Factory function to create a prover client.
@@ -305,6 +683,9 @@ def create_prover_client(
     Args:
         prover_url: Optional custom prover URL
         timeout: Max seconds to wait for proof
+        callback_url: Optional public URL for pushed results
+        callback_port: Local port behind callback_url
+        callback_host: Interface the callback server binds to
         
     Returns:
         Configured ProverClient
@@ -312,4 +693,7 @@ def create_prover_client(
     return ProverClient(
         prover_url=prover_url,
         timeout=timeout,
+        callback_url=callback_url,
+        callback_port=callback_port,
+        callback_host=callback_host,
     )
@@ -6,9 +6,13 @@ Fully Docker-free implementation:
 - Mine/Claim: Direct web3 contract calls (no prover needed!)
 """
 
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Optional
+from itertools import groupby
+from typing import Iterable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import threading
 import time
 
 from .config import FarmingConfig, WalletConfig
@@ -16,11 +20,22 @@ from .prover import ProverClient, ProofInput, ProofOutput, ProverError, create_p
 from .contracts import (
     BethContract, ContractError, create_beth_contract,
     WormContract, create_worm_contract,
+    create_rpc_tx_session,
 )
 from .crypto import generate_burn_inputs
 from .utils.logger import get_logger
 
 
+# ETH/BETH have 18 decimals
+_WEI_PER_ETH = Decimal(10 ** 18)
+
+# Max PoW results kept for burns that failed before broadcasting
+BURN_KEY_CACHE_SIZE = 32
+
+# Seconds a prover health check result is reused
+PROVER_HEALTH_TTL = 10.0
+
+
 class RemoteMinerError(Exception):
     """Raised when remote miner operation fails."""
     pass
@@ -58,13 +73,48 @@ class RemoteMinerClient:
         self.prover = create_prover_client(
             prover_url=config.prover_url,
             timeout=config.prover_timeout,
+            callback_url=config.prover_callback_url,
+            callback_port=config.prover_callback_port,
+            callback_host=config.prover_callback_host,
         )
-        self.beth_contract = create_beth_contract(config)
-        self.worm_contract = create_worm_contract(config)
+        # Both contract clients share one keep-alive connection pool
+        rpc_session = create_rpc_tx_session()
+        self.beth_contract = create_beth_contract(config, rpc_session)
+        self.worm_contract = create_worm_contract(config, rpc_session)
+        
+        # (monotonic timestamp, healthy) of the last prover probe
+        self._prover_health: Optional[Tuple[float, bool]] = None
+        
+        # (address, amount_wei, spend_wei, fee_wei) -> (burn_key, extra_commit)
+        # for burns that failed before their TX went out, so a retry skips
+        # the PoW. Never reused once broadcast: a burn key must be spent once.
+        self._burn_keys: "OrderedDict[tuple, Tuple[int, int]]" = OrderedDict()
+        self._burn_keys_lock = threading.Lock()
+        
+        # ProofInput fields that are the same for every burn
+        self._proof_defaults = {
+            "network": config.network,
+            "broadcaster_fee": "0",
+            "prover_fee": "0",
+            "receiver_hook": "0x",
+        }
     
     def check_prover(self) -> bool:
-        """Check if prover service is available."""
-        return self.prover.check_health()
+        """Check if prover service is available (cached for PROVER_HEALTH_TTL)."""
+        cached = self._prover_health
+        if cached is not None and time.monotonic() - cached[0] < PROVER_HEALTH_TTL:
+            return cached[1]
+        
+        healthy = self.prover.check_health()
+        self._prover_health = (time.monotonic(), healthy)
+        return healthy
+    
+    def warm_up(self):
+        """Pre-connect to the prover endpoints and transaction RPC (best effort)."""
+        # One call warms the RPC pool both contract clients share
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(self.prover.warm_up)
+            executor.submit(self.beth_contract.warm_up)
     
     def burn(
         self,
@@ -85,75 +135,81 @@ class RemoteMinerClient:
         Returns:
             MinerResult with operation status
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             self.logger.info(
-                f"🔥 Remote burn: {amount} ETH → {spend} BETH for {wallet.short_address}"
+                "🔥 Remote burn: %s ETH → %s BETH for %s", amount, spend, wallet.short_address
             )
             
             # Convert to wei
-            from web3 import Web3
-            amount_wei = Web3.to_wei(amount, 'ether')
-            spend_wei = Web3.to_wei(spend, 'ether')
-            fee_wei = Web3.to_wei(fee, 'ether')
-            
-            # Step 1: Generate burn_key (client-side PoW)
-            self.logger.info("🔐 Generating burn key (PoW)...")
-            burn_key, extra_commit = generate_burn_inputs(
-                wallet_address=wallet.address,
-                amount_wei=amount_wei,
-                spend_wei=spend_wei,
-                fee_wei=fee_wei,
-            )
-            self.logger.debug(f"burn_key: {burn_key}")
+            amount_wei = int(amount * _WEI_PER_ETH)
+            spend_wei = int(spend * _WEI_PER_ETH)
+            fee_wei = int(fee * _WEI_PER_ETH)
+            
+            # Step 1: Generate burn_key (client-side PoW), unless a retry
+            # of a burn that never reached the chain already has one
+            key = (wallet.address, amount_wei, spend_wei, fee_wei)
+            with self._burn_keys_lock:
+                cached = self._burn_keys.get(key)
+            if cached is not None:
+                self.logger.info("🔐 Reusing burn key from the previous attempt")
+                burn_key, extra_commit = cached
+            else:
+                self.logger.info("🔐 Generating burn key (PoW)...")
+                burn_key, extra_commit = generate_burn_inputs(
+                    wallet_address=wallet.address,
+                    amount_wei=amount_wei,
+                    spend_wei=spend_wei,
+                    fee_wei=fee_wei,
+                )
+                with self._burn_keys_lock:
+                    self._burn_keys[key] = (burn_key, extra_commit)
+                    if len(self._burn_keys) > BURN_KEY_CACHE_SIZE:
+                        self._burn_keys.popitem(last=False)
+            self.logger.debug("burn_key: %s", burn_key)
             
             # Step 2: Create proof input
             proof_input = ProofInput(
-                network=self.config.network,
+                **self._proof_defaults,
                 amount=str(amount),
-                broadcaster_fee="0",
-                prover_fee="0",
                 spend=str(spend),
                 burn_key=str(burn_key),
                 wallet_address=wallet.address,
-                receiver_hook="0x",
             )
             
             # Step 3: Get proof from remote prover
             self.logger.info("📡 Requesting proof from remote prover...")
             proof_output = self.prover.generate_proof(proof_input)
             
-            self.logger.info(f"✓ Proof generated! Burn address: {proof_output.burn_address[:16]}...")
+            self.logger.info("✓ Proof generated! Burn address: %s...", proof_output.burn_address[:16])
+            
+            # The burn is about to go on-chain - its key must not be reused
+            with self._burn_keys_lock:
+                self._burn_keys.pop(key, None)
             
-            # Step 4: Send ETH to burn address
-            self.beth_contract.send_burn_tx(
+            # Steps 4+5: Burn ETH and mint BETH - both TXs are signed with
+            # consecutive nonces and broadcast together
+            _, mint_tx = self.beth_contract.burn_and_mint(
                 wallet=wallet,
                 burn_address=proof_output.burn_address,
                 amount=amount,
-            )
-            
-            # Step 5: Submit proof to mint BETH
-            mint_tx = self.beth_contract.mint_from_proof(
-                wallet=wallet,
                 proof_output=proof_output,
-                spend=spend,
             )
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.logger.info(
-                f"[success]✓[/success] Burn complete! Minted {spend} BETH in {duration:.1f}s"
+                "[success]✓[/success] Burn complete! Minted %s BETH in %.1fs", spend, duration
             )
             
             return MinerResult(success=True, tx_hash=mint_tx, duration=duration)
             
-        except (ProverError, ContractError) as e:
-            duration = time.time() - start_time
-            self.logger.error(f"[error]✗[/error] Burn failed: {e}")
-            return MinerResult(success=False, error_message=str(e), duration=duration)
         except Exception as e:
-            duration = time.time() - start_time
-            self.logger.error(f"[error]✗[/error] Burn failed: {e}")
+            if isinstance(e, ProverError):
+                # Don't vouch for a prover that just failed us
+                self._prover_health = None
+            duration = time.perf_counter() - start_time
+            self.logger.error("[error]✗[/error] Burn failed: %s", e)
             return MinerResult(success=False, error_message=str(e), duration=duration)
     
     def mine(
@@ -175,7 +231,7 @@ class RemoteMinerClient:
         Returns:
             MinerResult with operation status
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Use config defaults
         amount = amount_per_epoch or self.config.beth_per_epoch
@@ -188,12 +244,12 @@ class RemoteMinerClient:
                 num_epochs=epochs,
             )
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return MinerResult(success=True, tx_hash=tx_hash, duration=duration)
             
         except ContractError as e:
-            duration = time.time() - start_time
-            self.logger.error(f"[error]✗[/error] Mine failed: {e}")
+            duration = time.perf_counter() - start_time
+            self.logger.error("[error]✗[/error] Mine failed: %s", e)
             return MinerResult(success=False, error_message=str(e), duration=duration)
     
     def claim(
@@ -203,7 +259,7 @@ class RemoteMinerClient:
         num_epochs: int,
     ) -> MinerResult:
         """
-        Claim WORM rewards from past epochs.
+        Claim WORM rewards from a contiguous range of past epochs.
         
         NO PROVER NEEDED - direct web3 contract call!
         
@@ -215,21 +271,42 @@ class RemoteMinerClient:
         Returns:
             MinerResult with operation status
         """
-        start_time = time.time()
+        return self.claim_range(wallet, range(starting_epoch, starting_epoch + num_epochs))
+    
+    def claim_range(self, wallet: WalletConfig, epochs: Iterable[int]) -> MinerResult:
+        """
+        Claim WORM rewards for arbitrary epochs with as few TXs as possible.
+        
+        Consecutive epochs are collapsed into one claim(start, count) call,
+        so e.g. [3, 1, 2, 7, 8] costs two transactions instead of five.
+        
+        Args:
+            wallet: Wallet to claim to
+            epochs: Epoch numbers to claim (any order, duplicates ignored)
+            
+        Returns:
+            MinerResult with the last claim TX; fails on the first error
+        """
+        start_time = time.perf_counter()
+        tx_hash = None
         
         try:
-            tx_hash = self.worm_contract.claim(
-                wallet=wallet,
-                starting_epoch=starting_epoch,
-                num_epochs=num_epochs,
-            )
+            ordered = sorted(set(epochs))
+            # Within a run of consecutive epochs, epoch - index is constant
+            for _, group in groupby(enumerate(ordered), key=lambda p: p[1] - p[0]):
+                run = [epoch for _, epoch in group]
+                tx_hash = self.worm_contract.claim(
+                    wallet=wallet,
+                    starting_epoch=run[0],
+                    num_epochs=len(run),
+                )
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return MinerResult(success=True, tx_hash=tx_hash, duration=duration)
             
         except ContractError as e:
-            duration = time.time() - start_time
-            self.logger.error(f"[error]✗[/error] Claim failed: {e}")
+            duration = time.perf_counter() - start_time
+            self.logger.error("[error]✗[/error] Claim failed: %s", e)
             return MinerResult(success=False, error_message=str(e), duration=duration)
 
 
@@ -1,6 +1,7 @@
-"""Utility modules for logging and retry logic."""
+"""Utility modules for logging, retry logic and HTTP sessions."""
 
 from .logger import setup_logger, get_logger
 from .retry import retry_with_backoff
+from .http import create_session
 
-__all__ = ["setup_logger", "get_logger", "retry_with_backoff"]
+__all__ = ["setup_logger", "get_logger", "retry_with_backoff", "create_session"]
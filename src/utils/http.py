@@ -0,0 +1,77 @@
+"""
+Pooled HTTP sessions with keep-alive for RPC and prover traffic.
+"""
+
+import socket
+from typing import List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+
+# Idle seconds before the first TCP keepalive probe, and between probes.
+# Below the ~60s idle timeout common on cloud load balancers.
+TCP_KEEPALIVE_IDLE = 30
+TCP_KEEPALIVE_INTERVAL = 15
+
+
+def _keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    """urllib3 socket options enabling TCP keepalive probes where supported."""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # Linux names; macOS only has TCP_KEEPALIVE, Windows neither
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE))
+    elif hasattr(socket, "TCP_KEEPALIVE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, TCP_KEEPALIVE_IDLE))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL))
+    return options
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets send TCP keepalive probes while idle."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _keepalive_socket_options())
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(
+    pool_connections: int = 16,
+    pool_maxsize: int = 32,
+    max_retries: Union[int, Retry] = 0,
+    headers: Optional[dict] = None,
+    tcp_keepalive: bool = False,
+) -> requests.Session:
+    """
+    Create a pooled keep-alive HTTP session.
+    
+    Reusing connections avoids a TCP+TLS handshake on every request.
+    
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Max connections kept alive per host
+        max_retries: Transport-level retries (int or urllib3 Retry)
+        headers: Extra default headers
+        tcp_keepalive: Probe idle pooled connections so middleboxes don't
+            silently drop them during long waits
+        
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter_cls = _KeepAliveAdapter if tcp_keepalive else HTTPAdapter
+    adapter = adapter_cls(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    if headers:
+        session.headers.update(headers)
+    return session
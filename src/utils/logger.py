@@ -2,8 +2,11 @@
 Structured logging with colors and optional file output.
 """
 
+import atexit
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -27,10 +30,26 @@ custom_theme = Theme({
     "wallet.4": "blue",
 })
 
-console = Console(theme=custom_theme)
+# Built on first setup_logger() call - importing this module (e.g. for a
+# dataclass elsewhere) shouldn't pay for Rich's terminal detection
+_console: Optional[Console] = None
 
-# Global logger registry
+
+def _get_console() -> Console:
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        _console = Console(theme=custom_theme)
+    return _console
+
+
+# Cycle banner separators
+_HEAVY_SEP = "═" * 50
+_LIGHT_SEP = "─" * 50
+
+# Global logger registry; writes hold the lock
 _loggers: dict[str, logging.Logger] = {}
+_loggers_lock = threading.Lock()
 
 
 def setup_logger(
@@ -51,49 +70,69 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
+    # Unlocked fast path - a plain dict read is atomic
     if name in _loggers:
         return _loggers[name]
     
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
-    logger.handlers.clear()
-    
-    # Rich console handler
-    console_handler = RichHandler(
-        console=console,
-        show_time=True,
-        show_path=False,
-        rich_tracebacks=True,
-        tracebacks_show_locals=True,
-        markup=True,
-    )
-    console_handler.setLevel(getattr(logging, level.upper(), logging.INFO))
-    logger.addHandler(console_handler)
-    
-    # File handler with rotation (prevents disk exhaustion)
-    if log_to_file and log_file:
-        from logging.handlers import RotatingFileHandler
+    # Wallet threads may race here; configure each logger exactly once
+    with _loggers_lock:
+        if name in _loggers:
+            return _loggers[name]
         
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        # Neither handler's format uses process info - skip collecting it
+        # for every LogRecord (os.getpid() plus a multiprocessing lookup)
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
         
-        # 10MB max per file, keep 5 backup files
-        file_handler = RotatingFileHandler(
-            log_path,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding="utf-8"
-        )
-        file_handler.setLevel(logging.DEBUG)  # Always DEBUG for file
-        file_formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
+        logger = logging.getLogger(name)
+        logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+        logger.handlers.clear()
+        
+        # Rich console handler. Rendering every frame's locals (wallets, proofs,
+        # ABIs) is slow and noisy, so only do it when debugging.
+        console_handler = RichHandler(
+            console=_get_console(),
+            show_time=True,
+            show_path=False,
+            rich_tracebacks=True,
+            tracebacks_show_locals=level.upper() == "DEBUG",
+            tracebacks_width=120,
+            markup=True,
         )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-    
-    _loggers[name] = logger
-    return logger
+        console_handler.setLevel(getattr(logging, level.upper(), logging.INFO))
+        logger.addHandler(console_handler)
+        
+        # File handler with rotation (prevents disk exhaustion)
+        if log_to_file and log_file:
+            from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+            
+            log_path = Path(log_file)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # 10MB max per file, keep 5 backup files
+            file_handler = RotatingFileHandler(
+                log_path,
+                maxBytes=10 * 1024 * 1024,  # 10MB
+                backupCount=5,
+                encoding="utf-8"
+            )
+            file_handler.setLevel(logging.DEBUG)  # Always DEBUG for file
+            file_formatter = logging.Formatter(
+                "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S"
+            )
+            file_handler.setFormatter(file_formatter)
+            
+            # Disk writes happen on a listener thread; logging calls only
+            # enqueue the record. Stopped (and flushed) at exit.
+            log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            logger.addHandler(QueueHandler(log_queue))
+        
+        _loggers[name] = logger
+        return logger
 
 
 def get_logger(name: str = "worm-farmer") -> logging.Logger:
@@ -103,10 +142,26 @@ def get_logger(name: str = "worm-farmer") -> logging.Logger:
     return setup_logger(name)
 
 
+class _WalletTagFilter(logging.Filter):
+    """Prefixes each record's message with a wallet tag."""
+    
+    def __init__(self, tag: str):
+        super().__init__()
+        self.tag = tag
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = f"{self.tag} {record.msg}"
+        return True
+
+
 def get_wallet_logger(wallet_index: int, address: str) -> logging.Logger:
     """
     Get a logger for a specific wallet with colored prefix.
     
+    Records propagate to the main logger's handlers with the colored short
+    address prepended, so lines from concurrently processed wallets can
+    be told apart.
+    
     Args:
         wallet_index: 0-based wallet index
         address: Wallet address (will be truncated)
@@ -123,42 +178,46 @@ def get_wallet_logger(wallet_index: int, address: str) -> logging.Logger:
     # Get color for this wallet
     color = WALLET_COLORS[wallet_index % len(WALLET_COLORS)]
     
-    # Create child logger from main logger
+    # Create child logger from main logger (outside the lock - get_logger
+    # may take it to configure the main logger)
     main_logger = get_logger("worm-farmer")
-    wallet_logger = main_logger.getChild(f"[{color}]{short_addr}[/{color}]")
     
-    _loggers[logger_name] = wallet_logger
-    return wallet_logger
+    with _loggers_lock:
+        if logger_name in _loggers:
+            return _loggers[logger_name]
+        wallet_logger = main_logger.getChild(short_addr)
+        wallet_logger.addFilter(_WalletTagFilter(f"[{color}]{short_addr}[/{color}]"))
+        _loggers[logger_name] = wallet_logger
+        return wallet_logger
 
 
 def log_operation_start(logger: logging.Logger, operation: str, details: str = ""):
     """Log the start of an operation with visual separator."""
-    logger.info(f"▶ [bold]{operation}[/bold] {details}")
+    logger.info("▶ [bold]%s[/bold] %s", operation, details)
 
 
 def log_operation_end(logger: logging.Logger, operation: str, success: bool, duration: float):
     """Log the end of an operation with result."""
     status = "[success]✓[/success]" if success else "[error]✗[/error]"
-    logger.info(f"{status} {operation} completed in {duration:.2f}s")
+    logger.info("%s %s completed in %.2fs", status, operation, duration)
 
 
 def log_balance(logger: logging.Logger, beth: float, eth: float):
     """Log wallet balances in a formatted way."""
-    logger.info(f"💰 BETH: [cyan]{beth:.6f}[/cyan] | ETH: [yellow]{eth:.6f}[/yellow]")
+    logger.info("💰 BETH: [cyan]%.6f[/cyan] | ETH: [yellow]%.6f[/yellow]", beth, eth)
 
 
 def log_cycle_start(cycle_num: int, wallet_count: int):
-    """Log the start of a farming cycle."""
-    logger = get_logger()
-    logger.info("")
-    logger.info(f"{'═' * 50}")
-    logger.info(f"🔄 [bold]CYCLE {cycle_num}[/bold] | {wallet_count} wallet(s) | {datetime.now().strftime('%H:%M:%S')}")
-    logger.info(f"{'═' * 50}")
+    """Log the start of a farming cycle (one multi-line record)."""
+    get_logger().info(
+        "\n%s\n🔄 [bold]CYCLE %d[/bold] | %d wallet(s) | %s\n%s",
+        _HEAVY_SEP, cycle_num, wallet_count, datetime.now().strftime("%H:%M:%S"), _HEAVY_SEP,
+    )
 
 
 def log_cycle_end(cycle_num: int, duration: float, next_cycle_in: int):
-    """Log the end of a farming cycle."""
-    logger = get_logger()
-    logger.info(f"{'─' * 50}")
-    logger.info(f"✅ Cycle {cycle_num} complete in {duration:.1f}s | Next cycle in {next_cycle_in}s")
-    logger.info("")
+    """Log the end of a farming cycle (one multi-line record)."""
+    get_logger().info(
+        "%s\n✅ Cycle %d complete in %.1fs | Next cycle in %ds\n",
+        _LIGHT_SEP, cycle_num, duration, next_cycle_in,
+    )
@@ -3,6 +3,7 @@ Retry decorator with exponential backoff for transient failures.
 """
 
 import functools
+import random
 import time
 import logging
 from typing import Callable, TypeVar, Any, Type, Tuple
@@ -36,12 +37,17 @@ def retry_with_backoff(
     """
     Decorator for retrying functions with exponential backoff.
     
+    Uses "full jitter": each wait is uniform in [0, cap], where cap grows
+    exponentially, so wallets failing together don't retry in lockstep.
+    
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay in seconds
         max_delay: Maximum delay cap in seconds
         exponential_base: Base for exponential backoff
-        exceptions: Tuple of exception types to catch and retry
+        exceptions: Tuple of exception types to catch and retry. Prefer a
+            common base class over listing many subclasses - each type in
+            the tuple is checked in turn on every failure.
         operation_name: Name for logging (defaults to function name)
         
     Returns:
@@ -53,19 +59,27 @@ def retry_with_backoff(
             ...
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        op_name = operation_name or func.__name__
+        # Frozen once - lets callers pass any iterable of types
+        exc_types = tuple(exceptions)
+        # Backoff cap after failed attempt n is caps[n - 1] - computed once here
+        caps = [
+            min(base_delay * (exponential_base ** (attempt - 1)), max_delay)
+            for attempt in range(1, max_retries)
+        ]
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            logger = get_logger()
-            op_name = operation_name or func.__name__
-            
             last_exception = None
             
             for attempt in range(1, max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                     
-                except exceptions as e:
+                except exc_types as e:
                     last_exception = e
+                    # Only looked up on failure - the success path stays lean
+                    logger = get_logger()
                     
                     if attempt == max_retries:
                         logger.error(
@@ -73,11 +87,7 @@ def retry_with_backoff(
                         )
                         raise MaxRetriesExceeded(op_name, attempt, e)
                     
-                    # Calculate backoff delay
-                    delay = min(
-                        base_delay * (exponential_base ** (attempt - 1)),
-                        max_delay
-                    )
+                    delay = random.uniform(0, caps[attempt - 1])
                     
                     logger.warning(
                         f"[warning]⚠[/warning] {op_name} attempt {attempt}/{max_retries} failed: {e}. "
@@ -102,24 +112,32 @@ def retry_async_with_backoff(
     operation_name: str = None,
 ) -> Callable:
     """
-    Async version of retry_with_backoff for asyncio functions.
+    Async version of retry_with_backoff for asyncio functions (same full-jitter backoff).
     """
     import asyncio
     
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        op_name = operation_name or func.__name__
+        # Frozen once - lets callers pass any iterable of types
+        exc_types = tuple(exceptions)
+        # Backoff cap after failed attempt n is caps[n - 1] - computed once here
+        caps = [
+            min(base_delay * (exponential_base ** (attempt - 1)), max_delay)
+            for attempt in range(1, max_retries)
+        ]
+        
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> T:
-            logger = get_logger()
-            op_name = operation_name or func.__name__
-            
             last_exception = None
             
             for attempt in range(1, max_retries + 1):
                 try:
                     return await func(*args, **kwargs)
                     
-                except exceptions as e:
+                except exc_types as e:
                     last_exception = e
+                    # Only looked up on failure - the success path stays lean
+                    logger = get_logger()
                     
                     if attempt == max_retries:
                         logger.error(
@@ -127,10 +145,7 @@ def retry_async_with_backoff(
                         )
                         raise MaxRetriesExceeded(op_name, attempt, e)
                     
-                    delay = min(
-                        base_delay * (exponential_base ** (attempt - 1)),
-                        max_delay
-                    )
+                    delay = random.uniform(0, caps[attempt - 1])
                     
                     logger.warning(
                         f"[warning]⚠[/warning] {op_name} attempt {attempt}/{max_retries} failed: {e}. "